@@ -13,27 +13,33 @@ Usage:
     $ poetry run python integration_tests/test_colregs_integration.py
 """
 
+import math
 import sys
 import numpy as np
 from pathlib import Path
 from typing import Dict, Any
 
-# Add paths
-sys.path.append('/home/hyo/PythonVehicleSimulator/src')
-sys.path.append('/home/hyo/DRL-otter-navigation')
-
 # Import colregs-core modules
 from colregs_core.utils import distance, cross_track_error
 from colregs_core.geometry import (
     heading_speed_to_velocity, 
     math_to_ned_heading,
+    math_to_ned_heading_array,
     math_to_maritime_position
 )
-from colregs_core.risk import ShipDomainParams, JeonCollisionRisk, ChunCollisionRisk
+from colregs_core.risk import (
+    ShipDomainParams,
+    JeonCollisionRisk,
+    ChunCollisionRisk,
+    select_most_dangerous,
+    collision_risk_table,
+)
 from colregs_core.reward import JeonRewardCalculator
-from colregs_core import EncounterClassifier
+from colregs_core import EncounterClassifier, EncounterSituation
 
 # Import irsim for simulation
+# (irsim, PythonVehicleSimulator and DRL-otter-navigation must be importable
+#  from the active environment, e.g. installed with `pip install -e`)
 import irsim
 
 
@@ -42,6 +48,17 @@ class COLREGsIntegrationTester:
     Integration tester for colregs-core modules in real simulation.
     """
     
+    # Multi-step summary table: (column name, printf format)
+    STEP_LOG_FIELDS = (
+        ('step', '%4d'),
+        ('x_math', '%8.2f'), ('y_math', '%8.2f'),
+        ('north', '%8.2f'), ('east', '%8.2f'),
+        ('hdg_math', '%8.2f'), ('hdg_ned', '%8.2f'),
+        ('d_goal', '%8.2f'),
+        ('max_cr', '%8.4f'),
+        ('reward', '%8.4f'),
+    )
+    
     def __init__(self, world_file: str = None):
         """
         Initialize tester with simulation environment.
@@ -116,9 +133,9 @@ class COLREGsIntegrationTester:
         os_position_math = [robot_state[0, 0], robot_state[1, 0]]
         os_position = list(math_to_maritime_position(os_position_math[0], os_position_math[1]))
         os_heading_rad = robot_state[2, 0]
-        os_heading_math = np.degrees(os_heading_rad)
+        os_heading_math = math.degrees(os_heading_rad)
         os_heading_deg = math_to_ned_heading(os_heading_math)
-        os_speed = np.linalg.norm([robot_state[3, 0], robot_state[4, 0]])
+        os_speed = math.hypot(robot_state[3, 0], robot_state[4, 0])
         os_velocity = heading_speed_to_velocity(os_heading_deg, os_speed)
         
         # Navigation metrics
@@ -128,7 +145,8 @@ class COLREGsIntegrationTester:
         y_e = cross_track_error(self.start_position, goal_position, os_position)
         
         # Target Ships (TS) data - find all dynamic obstacles
-        ts_list = []
+        ts_ids = []
+        raw_states = []
         for i, obstacle in enumerate(self.env.obstacle_list):
             # Original filter, which should now work correctly
             if hasattr(obstacle, 'static') and obstacle.static:
@@ -136,21 +154,42 @@ class COLREGsIntegrationTester:
             
             ts_state = obstacle.state
             if ts_state.shape[0] >= 5:  # Has velocity components
-                ts_position_math = [ts_state[0, 0], ts_state[1, 0]]
-                ts_position = list(math_to_maritime_position(ts_position_math[0], ts_position_math[1]))
-                ts_heading_math = np.degrees(ts_state[2, 0])
-                ts_heading_deg = math_to_ned_heading(ts_heading_math)
-                ts_speed = np.linalg.norm([ts_state[3, 0], ts_state[4, 0]])
-                ts_velocity = heading_speed_to_velocity(ts_heading_deg, ts_speed)
-                
-                ts_list.append({
-                    'id': i,
-                    'position': ts_position,
-                    'position_math': ts_position_math,
-                    'velocity': ts_velocity,
-                    'heading': ts_heading_deg,
-                    'speed': ts_speed
-                })
+                raw_states.append(ts_state[:5, 0])
+                ts_ids.append(i)
+        raw = np.array(raw_states, dtype=float).reshape(-1, 5)  # math [x, y, psi, u, v]
+        
+        # Math -> NED conversion for all TS at once
+        ts_positions = raw[:, [1, 0]]  # North = math y, East = math x
+        ts_headings = np.degrees(raw[:, 2])
+        math_to_ned_heading_array(ts_headings, out=ts_headings)
+        ts_speeds = np.hypot(raw[:, 3], raw[:, 4])
+        ts_heading_rad = np.radians(ts_headings)
+        ts_velocities = np.stack(
+            [ts_speeds * np.cos(ts_heading_rad), ts_speeds * np.sin(ts_heading_rad)], axis=1
+        )
+        
+        ts_list = [
+            {
+                'id': int(ts_id),
+                'position': position,
+                'position_math': [x_math, y_math],
+                'velocity': tuple(velocity),
+                'heading': heading,
+                'speed': speed
+            }
+            for ts_id, position, (x_math, y_math), velocity, heading, speed in zip(
+                ts_ids, ts_positions.tolist(), raw[:, :2].tolist(),
+                ts_velocities.tolist(), ts_headings.tolist(), ts_speeds.tolist()
+            )
+        ]
+        
+        # Structure-of-arrays form of the TS list for the batch APIs
+        ts_arrays = {
+            'positions': ts_positions,
+            'velocities': ts_velocities,
+            'headings': ts_headings,
+            'speeds': ts_speeds,
+        }
         
         return {
             'os': {
@@ -162,6 +201,7 @@ class COLREGsIntegrationTester:
                 'speed': os_speed
             },
             'ts_list': ts_list,
+            'ts_arrays': ts_arrays,
             'navigation': {
                 'distance_to_goal': dist_to_goal,
                 'cross_track_error': y_e
@@ -200,10 +240,11 @@ class COLREGsIntegrationTester:
         print(f"  Input heading: {os['heading']:.2f}°")
         print(f"  Speed: {os['speed']:.4f} m/s")
         print(f"  Output velocity: [{velocity_calculated[0]:.4f}, {velocity_calculated[1]:.4f}] m/s")
-        print(f"  Magnitude: {np.linalg.norm(velocity_calculated):.4f} m/s")
+        magnitude = math.hypot(velocity_calculated[0], velocity_calculated[1])
+        print(f"  Magnitude: {magnitude:.4f} m/s")
         
         # Verify magnitude matches speed
-        magnitude_error = abs(np.linalg.norm(velocity_calculated) - os['speed'])
+        magnitude_error = abs(magnitude - os['speed'])
         print(f"\n✅ Magnitude error: {magnitude_error:.6f} m/s (should be ~0)")
         
         return {
@@ -259,6 +300,32 @@ class COLREGsIntegrationTester:
             'cross_track_error': y_e_calculated
         }
     
+    def compute_risk_arrays(self, states: Dict[str, Any],
+                            detail: str = 'full') -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Calculate Jeon and Chun collision risk for all target ships at once.
+        
+        Results stay as arrays (index i = ts_list[i]); no per-TS dicts are built.
+        
+        Args:
+            states: Vessel states dictionary
+            detail: 'full' for every CR field, 'risk_only' for cr/dcpa/tcpa only
+            
+        Returns:
+            {'jeon': {...arrays}, 'chun': {...arrays}}
+        """
+        os = states['os']
+        ts_arrays = states['ts_arrays']
+        args = (
+            os['speed'], os['position'], os['velocity'], os['heading'],
+            ts_arrays['speeds'], ts_arrays['positions'],
+            ts_arrays['velocities'], ts_arrays['headings']
+        )
+        return {
+            'jeon': self.jeon_cr.calculate_collision_risk_batch(*args, detail=detail),
+            'chun': self.chun_cr.calculate_collision_risk_batch(*args, detail=detail)
+        }
+    
     def test_risk_module(self, states: Dict[str, Any]) -> Dict[str, Any]:
         """
         Test collision risk calculation modules for all target ships.
@@ -267,66 +334,54 @@ class COLREGsIntegrationTester:
             states: Vessel states dictionary
             
         Returns:
-            A dictionary with lists of collision risk results for each TS.
+            A dictionary with the risk arrays ('jeon', 'chun') and
+            per-TS record tables ('jeon_results', 'chun_results').
         """
         print("\n" + "=" * 60)
         print("⚠️  Testing Risk Module (Collision Risk)")
         print("=" * 60)
         
-        os = states['os']
         ts_list = states['ts_list']
+        risk_arrays = self.compute_risk_arrays(states)
+        
+        # One record per TS (row['cr'] etc.), index i = ts_list[i]
+        jeon_table = collision_risk_table(risk_arrays['jeon'])
+        chun_table = collision_risk_table(risk_arrays['chun'])
         
         if not ts_list:
             print("❌ No target ships found - skipping CR tests")
-            return {'jeon_results': [], 'chun_results': []}
+            return {'jeon_results': jeon_table, 'chun_results': chun_table, **risk_arrays}
 
-        all_jeon_results = []
-        all_chun_results = []
-
-        for ts in ts_list:
+        for ts, jeon_result, chun_result in zip(ts_list, jeon_table, chun_table):
             print(f"\n--- Target Ship ID: {ts['id']} ---")
             
-            # Test Jeon CR
+            # Jeon CR
             print("1️⃣  Jeon Collision Risk:")
-            jeon_result = self.jeon_cr.calculate_collision_risk(
-                os_position=os['position'],
-                os_velocity=os['velocity'],
-                os_heading=os['heading'],
-                ts_position=ts['position'],
-                ts_velocity=ts['velocity']
-            )
             print(f"  CR value: {jeon_result['cr']:.4f}")
             print(f"  DCPA: {jeon_result['dcpa']:.2f} m")
             print(f"  TCPA: {jeon_result['tcpa']:.2f} s")
             print(f"  Relative bearing: {jeon_result['relative_bearing']:.2f}°")
             print(f"  Ship domain radius: {jeon_result['ship_domain_radius']:.2f} m")
-            all_jeon_results.append(jeon_result)
             
-            # Test Chun CR
+            # Chun CR
             print("\n2️⃣  Chun Collision Risk:")
-            chun_result = self.chun_cr.calculate_collision_risk(
-                os_position=os['position'],
-                os_velocity=os['velocity'],
-                os_heading=os['heading'],
-                ts_position=ts['position'],
-                ts_velocity=ts['velocity']
-            )
             print(f"  CR value: {chun_result['cr']:.4f}")
             print(f"  DCPA: {chun_result['dcpa']:.2f} m")
             print(f"  TCPA: {chun_result['tcpa']:.2f} s")
-            all_chun_results.append(chun_result)
 
         print(f"\n✅ Risk module tested for {len(ts_list)} target ship(s).")
         
         return {
-            'jeon_results': all_jeon_results,
-            'chun_results': all_chun_results
+            'jeon_results': jeon_table,
+            'chun_results': chun_table,
+            **risk_arrays
         }
     
     def test_reward_module(self, states: Dict[str, Any], 
                           risk_results: Dict[str, Any],
                           prev_distance: float = None,
-                          prev_heading: float = None) -> Dict[str, Any]:
+                          prev_heading: float = None,
+                          verbose: bool = True) -> Dict[str, Any]:
         """
         Test reward calculation module.
         
@@ -335,16 +390,19 @@ class COLREGsIntegrationTester:
         
         Args:
             states: Vessel states dictionary
-            risk_results: Dictionary containing risk calculation results
+            risk_results: Dictionary containing the risk arrays ('jeon', 'chun')
             prev_distance: Previous distance to goal
             prev_heading: Previous heading (NED)
+            verbose: Print the reward breakdown (off for multi-step runs,
+                     which log one table row per step instead)
             
         Returns:
             Reward calculation results
         """
-        print("\n" + "=" * 60)
-        print("🎁 Testing Reward Module (Jeon Reward)")
-        print("=" * 60)
+        if verbose:
+            print("\n" + "=" * 60)
+            print("🎁 Testing Reward Module (Jeon Reward)")
+            print("=" * 60)
         
         os = states['os']
         ts_list = states['ts_list']
@@ -355,13 +413,13 @@ class COLREGsIntegrationTester:
         highest_cr = -1.0
         
         if ts_list:
-            for i, ts in enumerate(ts_list):
-                jeon_cr = risk_results['jeon_results'][i]['cr']
-                if jeon_cr > highest_cr:
-                    highest_cr = jeon_cr
-                    most_dangerous_ts = ts
-            print(f"Most dangerous TS for reward calculation: ID {most_dangerous_ts['id']} (CR: {highest_cr:.4f})")
-        else:
+            jeon = risk_results['jeon']
+            index = select_most_dangerous(jeon['cr'], jeon['tcpa'])
+            highest_cr = jeon['cr'][index]
+            most_dangerous_ts = ts_list[index]
+            if verbose:
+                print(f"Most dangerous TS for reward calculation: ID {most_dangerous_ts['id']} (CR: {highest_cr:.4f})")
+        elif verbose:
             print("No target ships for safety reward calculation.")
 
         # Prepare TS data for reward calculation
@@ -400,6 +458,9 @@ class COLREGsIntegrationTester:
             w_safety=1.0
         )
         
+        if not verbose:
+            return reward_dict
+        
         print(f"\n📈 Efficiency Rewards:")
         print(f"  r_goal: {reward_dict['r_goal']:.4f}")
         print(f"  r_cross: {reward_dict['r_cross']:.4f}")
@@ -439,17 +500,21 @@ class COLREGsIntegrationTester:
             print("❌ No target ships found - skipping classification")
             return []
 
+        # Classify all target ships in a single batch call
+        ts_arrays = states['ts_arrays']
+        batch = self.encounter_classifier.classify_batch(
+            os_position=os['position'],
+            os_heading=os['heading'],
+            os_speed=os['speed'],
+            ts_positions=ts_arrays['positions'],
+            ts_headings=ts_arrays['headings'],
+            ts_speeds=ts_arrays['speeds']
+        )
+        
         all_results = []
-        for ts in ts_list:
+        for i, ts in enumerate(ts_list):
+            result = EncounterSituation(*(field[i] for field in batch))
             print(f"\n--- Target Ship ID: {ts['id']} ---")
-            result = self.encounter_classifier.classify(
-                os_position=os['position'],
-                os_heading=os['heading'],
-                os_speed=os['speed'],
-                ts_position=ts['position'],
-                ts_heading=ts['heading'],
-                ts_speed=ts['speed']
-            )
             print(f"Encounter type: {result.encounter_type.value}")
             print(f"  Relative bearing: {result.relative_bearing:.2f}°")
             print(f"  Relative course: {result.relative_course:.2f}°")
@@ -527,11 +592,10 @@ class COLREGsIntegrationTester:
         prev_distance = None
         prev_heading = None
         
+        # One row per step, printed as a single table after the loop
+        step_log = np.empty((num_steps, len(self.STEP_LOG_FIELDS)))
+        
         for step in range(num_steps):
-            print(f"\n{'─' * 60}")
-            print(f"Step {step + 1}/{num_steps}")
-            print(f"{'─' * 60}")
-            
             # Execute step
             action = np.array([[action_u], [action_r]])
             self.env.step(action_id=0, action=action)
@@ -539,21 +603,22 @@ class COLREGsIntegrationTester:
             # Extract states
             states = self.extract_vessel_states()
             
-            # Calculate CR for all ships
-            risk_results = self.test_risk_module(states)
+            # Calculate CR for all ships (arrays only, CR/DCPA/TCPA is all we need here)
+            risk_results = self.compute_risk_arrays(states, detail='risk_only')
 
             # Calculate rewards with previous values
             reward_results = self.test_reward_module(
                 states, 
                 risk_results,
                 prev_distance=prev_distance,
-                prev_heading=prev_heading
+                prev_heading=prev_heading,
+                verbose=False
             )
             
             # Find max Jeon CR for this step
             max_jeon_cr = 0.0
-            if risk_results['jeon_results']:
-                max_jeon_cr = max(r['cr'] for r in risk_results['jeon_results'])
+            if states['ts_list']:
+                max_jeon_cr = float(np.max(risk_results['jeon']['cr']))
 
             # Store results
             step_result = {
@@ -574,15 +639,22 @@ class COLREGsIntegrationTester:
             prev_distance = states['navigation']['distance_to_goal']
             prev_heading = states['os']['heading']
             
-            # Quick summary for this step
-            print(f"\n📊 Step Summary:")
-            print(f"  Math position: [{states['os']['position_math'][0]:.2f}, {states['os']['position_math'][1]:.2f}]")
-            print(f"  NED position:  [{states['os']['position'][0]:.2f}, {states['os']['position'][1]:.2f}]")
-            print(f"  Math heading: {states['os']['heading_math']:.2f}°")
-            print(f"  NED heading:  {states['os']['heading']:.2f}°")
-            print(f"  Distance to goal: {states['navigation']['distance_to_goal']:.2f} m")
-            print(f"  Max Jeon CR: {max_jeon_cr:.4f}")
-            print(f"  Reward: {reward_results['r_total']:.4f}")
+            # Summary row for this step
+            step_log[step] = (
+                step + 1,
+                *states['os']['position_math'],
+                *states['os']['position'],
+                states['os']['heading_math'],
+                states['os']['heading'],
+                states['navigation']['distance_to_goal'],
+                max_jeon_cr,
+                reward_results['r_total'],
+            )
+        
+        print(f"\n📊 Step Summary:")
+        formats = [fmt for _, fmt in self.STEP_LOG_FIELDS]
+        header = " ".join(name.rjust(len(fmt % 0)) for name, fmt in self.STEP_LOG_FIELDS)
+        np.savetxt(sys.stdout, step_log, fmt=formats, header=header, comments="")
         
         # Final summary
         print("\n" + "=" * 60)
@@ -5,8 +5,14 @@ A comprehensive package for COLREGs-based encounter situation classification
 and collision risk assessment for maritime navigation.
 """
 
-from .encounter.classifier import EncounterClassifier
-from .encounter.types import EncounterType, EncounterSituation, RiskLevel, CollisionRisk
+from .encounter.classifier import EncounterClassifier, get_action_requirement
+from .encounter.types import (
+    EncounterType,
+    EncounterSituation,
+    EncounterSituationBatch,
+    RiskLevel,
+    CollisionRisk,
+)
 
 
 __version__ = "0.1.0"
@@ -15,10 +21,12 @@ __author__ = "Maritime Robotics Lab"
 __all__ = [
     # Main classes
     "EncounterClassifier",
+    "get_action_requirement",
     
     # Types and enums
     "EncounterType",
     "EncounterSituation", 
+    "EncounterSituationBatch",
     "RiskLevel",
     "CollisionRisk"
 ]
@@ -1,15 +1,83 @@
 """
 COLREGs Rule 13, 14, 15 기반 Encounter Situation 분류
 """
+import math
 import numpy as np
 from typing import Tuple, Optional
 
-from .types import EncounterType, EncounterSituation
-from ..geometry import (
-    calculate_relative_bearing,
-    calculate_aspect_angle,
-)
-from ..utils import WrapTo360, distance
+from .types import EncounterType, EncounterSituation, EncounterSituationBatch
+from ..geometry.kernels import _encounter_geometry, _run_encounter_geometry_batch
+from ..utils import WrapTo360, WrapTo360Array, extract_xy
+
+
+# classify_batch_codes의 encounter code (int8) -> EncounterType / EncounterType.value
+_ENCOUNTER_TYPES = np.array([
+    EncounterType.SAFE,
+    EncounterType.OVERTAKING,
+    EncounterType.HEAD_ON,
+    EncounterType.CROSSING_GIVE_WAY,
+    EncounterType.CROSSING_STAND_ON,
+], dtype=object)
+_ENCOUNTER_VALUES = np.array([t.value for t in _ENCOUNTER_TYPES])
+
+# Sector code: 모든 R/TSR 경계가 22.5°의 배수이므로 [0, 360) 각도를
+# "k * 22.5° 위 (2k)" / "(k * 22.5°, (k+1) * 22.5°) 내부 (2k+1)"의 32개 code로 나누면
+# Rule 13, 14, 15 판정 결과는 (bearing code, course code) 쌍마다 상수가 된다
+_SECTOR_STEP = 22.5
+_NUM_SECTOR_CODES = 32
+
+
+def _sector_code(deg: float) -> int:
+    """[0, 360) 각도 -> sector code (0 ~ 31)"""
+    k = math.floor(deg / _SECTOR_STEP)
+    # 나눗셈 반올림으로 경계 바로 아래 값이 위 구간으로 가지 않도록 보정
+    if k * _SECTOR_STEP > deg:
+        k -= 1
+    return 2 * k + (k * _SECTOR_STEP != deg)
+
+
+def _sector_codes(deg: np.ndarray) -> np.ndarray:
+    """_sector_code의 배열 버전"""
+    k = np.floor(deg / _SECTOR_STEP)
+    k -= k * _SECTOR_STEP > deg
+    return np.asarray(2 * k + (k * _SECTOR_STEP != deg), dtype=np.intp)
+
+
+# 조우 상황별 COLREGs 조치 요구사항 (상수 문자열)
+ACTION_REQUIREMENTS = {
+    EncounterType.HEAD_ON: (
+        "Rule 14: 양 선박 모두 우현으로 변침하여 서로의 좌현을 지나가도록 해야 함"
+    ),
+    EncounterType.OVERTAKING: (
+        "Rule 13: 추월선은 피항선. 피추월선의 진로를 방해하지 않도록 충분히 피항해야 함"
+    ),
+    EncounterType.CROSSING_GIVE_WAY: (
+        "Rule 15: OS가 give-way vessel. 상대선의 진로를 피해야 함. "
+        "일반적으로 우현 변침 또는 감속"
+    ),
+    EncounterType.CROSSING_STAND_ON: (
+        "Rule 15: OS가 stand-on vessel. 침로와 속력 유지해야 함. "
+        "단, 상대선이 적절한 조치를 하지 않을 경우 Rule 17(a)(ii)에 따라 조치"
+    ),
+    EncounterType.SAFE: "충돌 위험 없음. 정상 항해 유지",
+    EncounterType.UNDEFINED: "상황 분류 불가. 주의 항해 및 상황 관찰"
+}
+
+
+def get_action_requirement(encounter_type: EncounterType) -> str:
+    """
+    조우 상황별 COLREGs 조치 요구사항
+    
+    classifier 상태와 무관한 상수 dict 조회이므로 instance 없이 호출할 수 있다.
+    
+    Args:
+        encounter_type: 조우 타입
+    
+    Returns:
+        조치 요구사항 설명 (알 수 없는 타입이면 "Unknown")
+    """
+    return ACTION_REQUIREMENTS.get(encounter_type, "Unknown")
+
 
 class EncounterClassifier:
     """
@@ -46,6 +114,9 @@ class EncounterClassifier:
     TSR6_START = 270.0
     TSR6_END = 292.5
 
+    # 조우 상황별 COLREGs 조치 요구사항 (module-level ACTION_REQUIREMENTS와 같은 dict)
+    ACTION_REQUIREMENTS = ACTION_REQUIREMENTS
+
     def __init__(
         self,
         safe_distance: float = 2000.0,  # meters
@@ -58,6 +129,9 @@ class EncounterClassifier:
         """
         self.safe_distance = safe_distance
         self.overtaking_tolerance = overtaking_tolerance
+        
+        # (bearing sector code, course sector code) -> encounter code
+        self._encounter_lut = self._build_encounter_lut()
     
     def classify(
         self,
@@ -71,20 +145,36 @@ class EncounterClassifier:
         """
         조우 상황 분류
         
+        단일 TS는 math 기반 scalar 경로로 계산한다 (NumPy 배열 생성 없음).
+        ts_heading이 (N,) np.ndarray이면 TS N척으로 보고 classify_batch로 위임한다
+        (위치 배열의 shape으로는 단일 위치와 TS 묶음을 구분하지 않음).
+        
         Args:
-            os_position: Own Ship 위치 (x, y) meters
+            os_position: Own Ship 위치 (x, y) meters (tuple/list 또는 (2,), (2, 1), (1, 2) 배열)
             os_heading: Own Ship heading (degrees, 0=North, CW)
             os_speed: Own Ship speed (m/s)
-            ts_position: Target Ship 위치 (x, y) meters
-            ts_heading: Target Ship heading (degrees)
-            ts_speed: Target Ship speed (m/s)
+            ts_position: Target Ship 위치 (x, y) meters (os_position과 같은 형식),
+                         ts_heading이 (N,) 배열이면 (N, 2) 배열
+            ts_heading: Target Ship heading (degrees), 또는 (N,) 배열
+            ts_speed: Target Ship speed (m/s), 또는 (N,) 배열
         
         Returns:
-            EncounterSituation 객체
+            EncounterSituation 객체 (ts_heading이 배열이면 EncounterSituationBatch)
         
         Raises:
             ValueError: If positions are invalid
         """
+        if isinstance(ts_heading, np.ndarray) and ts_heading.ndim > 0:
+            return self.classify_batch(
+                os_position, os_heading, os_speed,
+                ts_position, ts_heading, ts_speed
+            )
+        # 단일 위치 배열 (column vector 포함)은 (x, y) float 쌍으로 변환
+        if isinstance(os_position, np.ndarray):
+            os_position = extract_xy(os_position)
+        if isinstance(ts_position, np.ndarray):
+            ts_position = extract_xy(ts_position)
+        
         # Input validation
         if not isinstance(os_position, (tuple, list)) or len(os_position) != 2:
             raise ValueError(f"os_position must be a tuple/list of length 2. Got {os_position}")
@@ -92,32 +182,56 @@ class EncounterClassifier:
         if not isinstance(ts_position, (tuple, list)) or len(ts_position) != 2:
             raise ValueError(f"ts_position must be a tuple/list of length 2. Got {ts_position}")
         
-        # 거리 계산
-        current_distance = distance(os_position, ts_position)
+        # 거리, 상대 방위각, aspect angle (TS에서 OS를 보는 방위)
+        current_distance, relative_bearing, aspect_angle = _encounter_geometry(
+            float(os_position[0]), float(os_position[1]), float(os_heading),
+            float(ts_position[0]), float(ts_position[1]), float(ts_heading)
+        )
+        
+        # 상대 침로 계산
+        relative_course = WrapTo360(ts_heading - os_heading)
+        
+        return self.classify_geometry(
+            current_distance, relative_bearing, relative_course, aspect_angle,
+            os_speed, ts_speed
+        )
+    
+    def classify_geometry(
+        self,
+        distance: float,
+        relative_bearing: float,
+        relative_course: float,
+        aspect_angle: float,
+        os_speed: float,
+        ts_speed: float
+    ) -> EncounterSituation:
+        """
+        이미 계산된 기하량으로 조우 상황 분류
+        
+        CR 계산처럼 거리/방위를 geometry.kernels._full_encounter로 함께 구한
+        경우, 같은 값을 다시 계산하지 않고 분류만 수행한다.
         
+        Args:
+            distance: OS-TS 거리 (meters)
+            relative_bearing: OS 기준 TS 상대 방위각 (degrees, 분류 시 [0, 360)으로 wrap)
+            relative_course: 상대 침로 (degrees, 분류 시 [0, 360)으로 wrap)
+            aspect_angle: TS 기준 OS 방위 (degrees, [0, 360))
+            os_speed: Own Ship speed (m/s)
+            ts_speed: Target Ship speed (m/s)
+        
+        Returns:
+            EncounterSituation 객체
+        """
         # 안전 거리 밖이면 SAFE
-        if current_distance > self.safe_distance:
+        if distance > self.safe_distance:
             return EncounterSituation(
                 encounter_type=EncounterType.SAFE,
                 relative_bearing=0.0,
                 relative_course=0.0,
-                distance=current_distance,
+                distance=distance,
                 aspect_angle=0.0
             )
         
-        # 상대 방위각 계산
-        relative_bearing = calculate_relative_bearing(
-            os_position, os_heading, ts_position
-        )
-        
-        # 상대 침로 계산
-        relative_course = WrapTo360(ts_heading - os_heading)
-        
-        # Aspect angle 계산 (TS에서 OS를 보는 방위)
-        aspect_angle = calculate_aspect_angle(
-            ts_heading, os_position, ts_position
-        )
-        
         # Encounter type 분류
         encounter_type = self._classify_encounter_type(
             relative_bearing, relative_course, aspect_angle,
@@ -128,10 +242,167 @@ class EncounterClassifier:
             encounter_type=encounter_type,
             relative_bearing=relative_bearing,
             relative_course=relative_course,
-            distance=current_distance,
+            distance=distance,
             aspect_angle=aspect_angle
         )
     
+    def classify_batch(
+        self,
+        os_position: Tuple[float, float],
+        os_heading: float,
+        os_speed: float,
+        ts_positions: np.ndarray,
+        ts_headings: np.ndarray,
+        ts_speeds: np.ndarray
+    ) -> EncounterSituationBatch:
+        """
+        다수 TS에 대한 조우 상황 일괄 분류 (classify의 벡터화 버전)
+        
+        거리/방위/침로/aspect는 classify와 같은 커널을 TS 배열에 대해 한 번에
+        실행하여 계산하고 (geometry.kernels._encounter_geometry_batch),
+        Rule 13, 14, 15 판정은 boolean mask로 처리한다. 결과는 TS별로
+        classify를 호출한 것과 동일하다.
+        
+        Args:
+            os_position: Own Ship 위치 (x, y) meters
+            os_heading: Own Ship heading (degrees, 0=North, CW)
+            os_speed: Own Ship speed (m/s)
+            ts_positions: Target Ship 위치 배열 (N, 2) meters
+            ts_headings: Target Ship heading 배열 (N,) degrees
+            ts_speeds: Target Ship speed 배열 (N,) m/s
+        
+        Returns:
+            EncounterSituationBatch 객체 (각 필드는 길이 N 배열)
+        
+        Raises:
+            ValueError: If array lengths do not match
+        """
+        codes, relative_bearing, relative_course, distances, aspect_angle = (
+            self.classify_batch_codes(
+                os_position, os_heading, os_speed,
+                ts_positions, ts_headings, ts_speeds
+            )
+        )
+        
+        return EncounterSituationBatch(
+            encounter_type=_ENCOUNTER_TYPES[codes],
+            relative_bearing=relative_bearing,
+            relative_course=relative_course,
+            distance=distances,
+            aspect_angle=aspect_angle
+        )
+    
+    def classify_batch_codes(
+        self,
+        os_position: Tuple[float, float],
+        os_heading: float,
+        os_speed: float,
+        ts_positions: np.ndarray,
+        ts_headings: np.ndarray,
+        ts_speeds: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        classify_batch의 수치 버전 (EncounterType 대신 int8 code 반환)
+        
+        배열 연산 경로에서는 Enum 객체를 만들지 않고 code로 다루고,
+        EncounterType으로의 변환은 API 경계(classify_batch)에서 한 번만 수행한다.
+        code: 0=SAFE, 1=OVERTAKING, 2=HEAD_ON, 3=CROSSING_GIVE_WAY, 4=CROSSING_STAND_ON
+        
+        Returns:
+            (codes, relative_bearing, relative_course, distance, aspect_angle) - 길이 N 배열
+        
+        Raises:
+            ValueError: If array lengths do not match
+        """
+        ts_positions = np.asarray(ts_positions, dtype=float).reshape(-1, 2)
+        ts_headings = np.asarray(ts_headings, dtype=float).reshape(-1)
+        ts_speeds = np.asarray(ts_speeds, dtype=float).reshape(-1)
+        
+        n = ts_positions.shape[0]
+        if ts_headings.shape[0] != n or ts_speeds.shape[0] != n:
+            raise ValueError(
+                f"ts_positions, ts_headings and ts_speeds must have the same length. "
+                f"Got {n}, {ts_headings.shape[0]}, {ts_speeds.shape[0]}"
+            )
+        
+        # 거리, 상대 방위각, 상대 침로, aspect angle (TS -> OS)
+        # 안전 거리 밖 TS는 classify와 동일하게 각도를 0으로 채움
+        distances, relative_bearing, relative_course, aspect_angle = (
+            _run_encounter_geometry_batch(
+                os_position, os_heading, ts_positions, ts_headings, self.safe_distance
+            )
+        )
+        
+        codes = self.classify_geometry_codes(distances, relative_bearing, relative_course)
+        
+        return codes, relative_bearing, relative_course, distances, aspect_angle
+    
+    def classify_geometry_codes(
+        self,
+        distance: np.ndarray,
+        relative_bearing: np.ndarray,
+        relative_course: np.ndarray
+    ) -> np.ndarray:
+        """
+        이미 계산된 기하량 배열로 조우 상황 분류 (classify_geometry의 배열 버전)
+        
+        CR batch 계산처럼 geometry.kernels._full_encounter_batch로 거리/방위를
+        함께 구한 경우 같은 값을 다시 계산하지 않고 분류만 수행한다.
+        
+        Args:
+            distance: OS-TS 거리 배열 (N,) meters
+            relative_bearing: 상대 방위각 배열 (N,) degrees (분류 시 [0, 360)으로 wrap)
+            relative_course: 상대 침로 배열 (N,) degrees (분류 시 [0, 360)으로 wrap)
+        
+        Returns:
+            encounter code 배열 (N,) int8 (classify_batch_codes 참고)
+        """
+        # 규칙 판정은 안전 거리 안의 TS에 대해서만 수행 (나머지는 SAFE)
+        codes = np.zeros(distance.shape[0], dtype=np.int8)
+        near = ~(distance > self.safe_distance)
+        if near.any():
+            codes[near] = self._classify_encounter_codes(
+                relative_bearing[near], relative_course[near]
+            )
+        return codes
+    
+    def _classify_encounter_codes(
+        self,
+        relative_bearing: np.ndarray,
+        relative_course: np.ndarray
+    ) -> np.ndarray:
+        """
+        _classify_encounter_type의 배열 버전
+        
+        Returns:
+            _ENCOUNTER_TYPES 인덱스 배열 (int8)
+        """
+        # sector code / lookup table은 [0, 360) 각도를 전제로 하므로 먼저 정규화
+        relative_bearing = WrapTo360Array(relative_bearing)
+        relative_course = WrapTo360Array(relative_course)
+        
+        if self._encounter_lut is not None:
+            valid = np.isfinite(relative_bearing) & np.isfinite(relative_course)
+            if valid.all():
+                return np.asarray(self._encounter_lut[
+                    _sector_codes(relative_bearing), _sector_codes(relative_course)
+                ], dtype=np.int8)
+            # NaN 각도는 어떤 규칙도 만족하지 않으므로 SAFE (_rule_masks와 동일)
+            codes = np.zeros(relative_bearing.shape, dtype=np.int8)
+            codes[valid] = self._encounter_lut[
+                _sector_codes(relative_bearing[valid]), _sector_codes(relative_course[valid])
+            ]
+            return codes
+        
+        overtaking, head_on, give_way, stand_on = self._rule_masks(
+            relative_bearing, relative_course
+        )
+        return np.select(
+            [overtaking, head_on, give_way, stand_on],
+            [1, 2, 3, 4],
+            default=0
+        ).astype(np.int8)
+    
     def _classify_encounter_type(
         self,
         relative_bearing: float,
@@ -144,8 +415,9 @@ class EncounterClassifier:
         조우 타입 분류 (COLREGs Rule 13, 14, 15)
         
         Args:
-            relative_bearing: 상대 방위각 [0, 360)
-            relative_course: 상대 침로 [0, 360) - normalized difference between TS and OS headings
+            relative_bearing: 상대 방위각 (degrees, [0, 360) 밖의 값은 wrap)
+            relative_course: 상대 침로 (degrees, [0, 360) 밖의 값은 wrap)
+                             - difference between TS and OS headings
             aspect_angle: TS의 aspect angle [0, 360)
             os_speed: OS 속도
             ts_speed: TS 속도
@@ -153,138 +425,116 @@ class EncounterClassifier:
         Returns:
             EncounterType
         """
-        # Rule 13: Overtaking
-        # Aspect angle 기준 R4 + Relative course 기준 TSR1 + 속도 비교
-        if self._is_overtaking(relative_bearing, relative_course, aspect_angle, os_speed, ts_speed):
-            return EncounterType.OVERTAKING
+        # sector code / lookup table은 [0, 360) 각도를 전제로 하므로 먼저 정규화
+        # (NaN 각도는 그대로 _rule_masks로 보내 어떤 규칙도 만족하지 않게 함)
+        if math.isfinite(relative_bearing) and math.isfinite(relative_course):
+            relative_bearing = WrapTo360(relative_bearing)
+            relative_course = WrapTo360(relative_course)
+            if self._encounter_lut is not None:
+                code = self._encounter_lut[
+                    _sector_code(relative_bearing), _sector_code(relative_course)
+                ]
+                return EncounterType(_ENCOUNTER_TYPES[code])
         
-        # Rule 14: Head-on
-        # Relative bearing 기준 R 6, 1, 2 중 하나에 있고
-        # Relative course 기준 TSR 4에 있는 경우
-        if self._is_head_on(relative_bearing, relative_course):
-            return EncounterType.HEAD_ON
+        overtaking, head_on, give_way, stand_on = self._rule_masks(
+            relative_bearing, relative_course
+        )
         
-        # Rule 15: Crossing
-        # Crossing Give-way
-        # Relative bearing 기준 R 1, 2, 3 중 하나에 있고 Relative course 기준 TSR 5, 6 중 하나에 있는 경우
-        # Relative bearing 기준 R4에 있고, Relative course 기준 TSR 6에 있는 경우
-        if self._is_crossing_give_way(relative_bearing, relative_course):
+        # 우선순위: Overtaking > Head-on > Give-way > Stand-on > SAFE
+        if overtaking:
+            return EncounterType.OVERTAKING
+        if head_on:
+            return EncounterType.HEAD_ON
+        if give_way:
             return EncounterType.CROSSING_GIVE_WAY
-
-        # Crossing Stand-on
-        # Relative bearing 기준 R5, R6, R1 중 하나에 있고 Relative course 기준 TSR 2, 3 중 하나에 있는 경우
-        # Relative bearing 기준 R4에 있고, Relative course 기준 TSR 2에 있는 경우
-        if self._is_crossing_stand_on(relative_bearing, relative_course):
+        if stand_on:
             return EncounterType.CROSSING_STAND_ON
-
+        
         # SAFE: 충돌 위험 없음
         return EncounterType.SAFE
     
-    def _is_overtaking(
-        self,
-        relative_bearing: float,
-        relative_course: float,
-        aspect_angle: float,
-        os_speed: float,
-        ts_speed: float
-    ) -> bool:
+    def _build_encounter_lut(self) -> Optional[np.ndarray]:
         """
-        Rule 13: Overtaking 판단
+        sector code 쌍 -> encounter code lookup table (32 x 32, int8) 생성
         
-        COLREGs Rule 13: "A vessel shall be deemed to be overtaking when coming up 
-        with another vessel from a direction more than 22.5 degrees abaft her beam"
+        각 code의 대표 각도 (경계: k * 22.5°, 내부: 구간 중앙)에 대해 _rule_masks를
+        평가하여 채우므로 분기 없이 lookup 한 번으로 같은 결과를 얻는다.
+        임계값이 22.5°의 배수가 아니면 None (_rule_masks로 직접 판정).
+        """
+        thresholds = (
+            self.R1_RANGE, self.R2_START, self.R2_END, self.R3_START, self.R3_END,
+            self.R4_START, self.R4_END, self.R5_START, self.R5_END,
+            self.R6_START, self.R6_END,
+            self.TSR1_RANGE, self.TSR2_START, self.TSR2_END, self.TSR3_START,
+            self.TSR3_END, self.TSR4_START, self.TSR4_END, self.TSR5_START,
+            self.TSR5_END, self.TSR6_START, self.TSR6_END,
+        )
+        if any(t % _SECTOR_STEP for t in thresholds):
+            return None
         
-        조건:
-        1. Relative course가 TSR1 영역 (±67.5°) - 거의 같은 방향
+        representative = np.arange(_NUM_SECTOR_CODES) * (_SECTOR_STEP / 2)
+        rb, rc = np.meshgrid(representative, representative, indexing='ij')
+        overtaking, head_on, give_way, stand_on = self._rule_masks(rb, rc)
+        return np.select(
+            [overtaking, head_on, give_way, stand_on],
+            [1, 2, 3, 4],
+            default=0
+        ).astype(np.int8)
+    
+    def _rule_masks(self, relative_bearing, relative_course):
         """
+        Rule 13, 14, 15 판정 (scalar classify와 classify_batch가 공유)
         
-        # Relative course 기준: 거의 같은 방향으로 항해
-        tsr1_sector = (relative_course <= self.TSR1_RANGE or 
-                      relative_course >= 360 - self.TSR1_RANGE)
+        비교 연산과 &, |만 사용하므로 float를 넣으면 bool,
+        np.ndarray를 넣으면 boolean 배열을 반환한다.
         
-        # OS가 TS보다 빠른지 확인
-        speed_check = os_speed > ts_speed
+        Args:
+            relative_bearing: 상대 방위각 [0, 360) (float 또는 배열)
+            relative_course: 상대 침로 [0, 360) (float 또는 배열)
         
-        return tsr1_sector
-    
-    def _is_head_on(
-        self,
-        relative_bearing: float,
-        relative_course: float
-    ) -> bool:
-        """
-        Rule 14: Head-on Situation 판단
+        Returns:
+            (overtaking, head_on, give_way, stand_on)
         """
-
-        r6_sector = self.R6_START < relative_bearing < self.R6_END
-        r1_sector = (relative_bearing <= self.R1_RANGE or 
-                      relative_bearing >= 360 - self.R1_RANGE)
-        r2_sector = self.R2_START < relative_bearing < self.R2_END
-
-        r612_sector = r6_sector or r1_sector or r2_sector
+        rb = relative_bearing
+        rc = relative_course
         
-        tsr4_sector = self.TSR4_START < relative_course < self.TSR4_END
-
-        return r612_sector and tsr4_sector
-    
-    def _is_crossing_give_way(self, relative_bearing: float, relative_course: float) -> bool:
-        """
-        Rule 15: Crossing - OS가 Give-way Vessel
+        # Relative bearing 기준 R1 ~ R6
+        r1 = (rb <= self.R1_RANGE) | (rb >= 360 - self.R1_RANGE)
+        r2 = (self.R2_START < rb) & (rb < self.R2_END)
+        r3 = (self.R3_START < rb) & (rb < self.R3_END)
+        r4 = (self.R4_START < rb) & (rb < self.R4_END)
+        r5 = (self.R5_START < rb) & (rb < self.R5_END)
+        r6 = (self.R6_START < rb) & (rb < self.R6_END)
         
-        조건:
-        1. (R1 or R2 or R3) + (TSR5 or TSR6) - 우현에서 교차
-        2. R4 + TSR6 - 후방에서 좌현으로 교차
-        """
-        r1_sector = (relative_bearing <= self.R1_RANGE or 
-                      relative_bearing >= 360 - self.R1_RANGE)
-        r2_sector = self.R2_START < relative_bearing < self.R2_END
-        r3_sector = self.R3_START < relative_bearing < self.R3_END
-        r4_sector = self.R4_START < relative_bearing < self.R4_END
-
-        r123_sector = r1_sector or r2_sector or r3_sector
-
-        tsr5_sector = self.TSR5_START < relative_course < self.TSR5_END
-        tsr6_sector = self.TSR6_START < relative_course < self.TSR6_END
-
-        tsr56_sector = tsr5_sector or tsr6_sector
+        # Relative course 기준 TSR1 ~ TSR6
+        tsr1 = (rc <= self.TSR1_RANGE) | (rc >= 360 - self.TSR1_RANGE)
+        tsr2 = (self.TSR2_START < rc) & (rc < self.TSR2_END)
+        tsr3 = (self.TSR3_START < rc) & (rc < self.TSR3_END)
+        tsr4 = (self.TSR4_START < rc) & (rc < self.TSR4_END)
+        tsr5 = (self.TSR5_START < rc) & (rc < self.TSR5_END)
+        tsr6 = (self.TSR6_START < rc) & (rc < self.TSR6_END)
         
-        # 조건 1 또는 조건 2를 만족하면 Give-way
-        if (r123_sector and tsr56_sector) or (r4_sector and tsr6_sector):
-            return True
+        # Rule 13: Overtaking
+        # Relative course가 TSR1 영역 (±67.5°) - 거의 같은 방향으로 항해
+        overtaking = tsr1
         
-        return False
-    
-    def _is_crossing_stand_on(self, relative_bearing: float, relative_course: float) -> bool:
-        """
-        Rule 15: Crossing - OS가 Stand-on Vessel
+        # Rule 14: Head-on
+        # Relative bearing 기준 R 6, 1, 2 중 하나에 있고
+        # Relative course 기준 TSR 4에 있는 경우
+        head_on = (r6 | r1 | r2) & tsr4
         
-        조건:
-        1. (R5 or R6 or R1) + (TSR2 or TSR3) - 좌현에서 교차
-        2. R4 + TSR2 - 후방에서 우현으로 교차
+        # Rule 15: Crossing Give-way
+        # 1. (R1 or R2 or R3) + (TSR5 or TSR6) - 우현에서 교차
+        # 2. R4 + TSR6 - 후방에서 좌현으로 교차
+        give_way = ((r1 | r2 | r3) & (tsr5 | tsr6)) | (r4 & tsr6)
         
-        Notes:
-            COLREGs Rule 15: "two power-driven vessels are CROSSING"
-            Crossing은 선박들이 서로 교차하는 침로에 있어야 함.
-            평행 항해(relative_course ≈ 0° 또는 180°)는 Crossing이 아님!
-        """
-        r4_sector = self.R4_START < relative_bearing < self.R4_END
-        r5_sector = self.R5_START < relative_bearing < self.R5_END
-        r6_sector = self.R6_START < relative_bearing < self.R6_END
-        r1_sector = (relative_bearing <= self.R1_RANGE or 
-                      relative_bearing >= 360 - self.R1_RANGE)
-
-        r561_sector = r5_sector or r6_sector or r1_sector
-
-        tsr2_sector = self.TSR2_START < relative_course < self.TSR2_END
-        tsr3_sector = self.TSR3_START < relative_course < self.TSR3_END
-
-        tsr23_sector = tsr2_sector or tsr3_sector
-
-        # 조건 1 또는 조건 2를 만족하면 Stand-on
-        if (r561_sector and tsr23_sector) or (r4_sector and tsr2_sector):
-            return True
+        # Rule 15: Crossing Stand-on
+        # 1. (R5 or R6 or R1) + (TSR2 or TSR3) - 좌현에서 교차
+        # 2. R4 + TSR2 - 후방에서 우현으로 교차
+        # 평행 항해(relative_course ≈ 0° 또는 180°)는 Crossing이 아님
+        stand_on = ((r5 | r6 | r1) & (tsr2 | tsr3)) | (r4 & tsr2)
         
-        return False
+        return overtaking, head_on, give_way, stand_on
     
     def get_action_requirement(self, encounter_type: EncounterType) -> str:
         """
@@ -296,22 +546,4 @@ class EncounterClassifier:
         Returns:
             조치 요구사항 설명
         """
-        actions = {
-            EncounterType.HEAD_ON: (
-                "Rule 14: 양 선박 모두 우현으로 변침하여 서로의 좌현을 지나가도록 해야 함"
-            ),
-            EncounterType.OVERTAKING: (
-                "Rule 13: 추월선은 피항선. 피추월선의 진로를 방해하지 않도록 충분히 피항해야 함"
-            ),
-            EncounterType.CROSSING_GIVE_WAY: (
-                "Rule 15: OS가 give-way vessel. 상대선의 진로를 피해야 함. "
-                "일반적으로 우현 변침 또는 감속"
-            ),
-            EncounterType.CROSSING_STAND_ON: (
-                "Rule 15: OS가 stand-on vessel. 침로와 속력 유지해야 함. "
-                "단, 상대선이 적절한 조치를 하지 않을 경우 Rule 17(a)(ii)에 따라 조치"
-            ),
-            EncounterType.SAFE: "충돌 위험 없음. 정상 항해 유지",
-            EncounterType.UNDEFINED: "상황 분류 불가. 주의 항해 및 상황 관찰"
-        }
-        return actions.get(encounter_type, "Unknown")
+        return get_action_requirement(encounter_type)
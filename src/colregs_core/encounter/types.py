@@ -1,9 +1,11 @@
 """
 COLREGs 기반 Encounter situation types 정의
 """
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import NamedTuple
 
+import numpy as np
+
 
 class EncounterType(Enum):
     """
@@ -17,9 +19,11 @@ class EncounterType(Enum):
     UNDEFINED = "undefined"          # 분류 불가
 
 
-class RiskLevel(Enum):
+class RiskLevel(IntEnum):
     """
     충돌 위험도 등급
+    
+    IntEnum이므로 등급끼리 int처럼 비교하고 np.int8 배열에 그대로 저장할 수 있다.
     """
     SAFE = 0        # 위험 없음
     LOW = 1         # 낮은 위험
@@ -39,6 +43,17 @@ class EncounterSituation(NamedTuple):
     aspect_angle: float      # TS의 aspect angle (degrees)
 
 
+class EncounterSituationBatch(NamedTuple):
+    """
+    다수 TS에 대한 조우 상황 분석 결과 (배열 i번째 = i번째 TS)
+    """
+    encounter_type: np.ndarray    # EncounterType 객체 배열 (N,)
+    relative_bearing: np.ndarray  # degrees, [0, 360) (N,)
+    relative_course: np.ndarray   # degrees, [0, 360) (N,)
+    distance: np.ndarray          # meters (N,)
+    aspect_angle: np.ndarray      # TS의 aspect angle (degrees) (N,)
+
+
 class CollisionRisk(NamedTuple):
     """
     충돌 위험 평가 결과
@@ -52,9 +67,9 @@ class CollisionRisk(NamedTuple):
     @property
     def is_dangerous(self) -> bool:
         """위험 상황 여부"""
-        return self.risk_level.value >= RiskLevel.HIGH.value
+        return self.risk_level >= RiskLevel.HIGH
     
     @property
     def requires_action(self) -> bool:
         """회피 조치 필요 여부"""
-        return self.risk_level.value >= RiskLevel.MEDIUM.value
+        return self.risk_level >= RiskLevel.MEDIUM
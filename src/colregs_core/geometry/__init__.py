@@ -4,15 +4,20 @@ Geometry utilities for maritime navigation
 
 from .bearings import (
     calculate_relative_bearing,
+    calculate_relative_bearing_batch,
     calculate_relative_velocity,
     heading_speed_to_velocity,
+    heading_rad_speed_to_velocity,
     velocity_to_heading_speed,
     calculate_aspect_angle,
+    calculate_bearing_rate,
+    calculate_bearing_rate_batch,
 )
 
 from .coordinate_transform import (
     ned_to_math_heading,
     math_to_ned_heading,
+    math_to_ned_heading_array,
     maritime_to_math_position,
     math_to_maritime_position,
     maritime_to_math_state,
@@ -22,17 +27,23 @@ from .coordinate_transform import (
     math_to_maritime_velocity,
     maritime_to_math_velocity,
 )
+from .kernels import warmup_kernels
 
 __all__ = [
     # bearings
     'calculate_relative_bearing',
+    'calculate_relative_bearing_batch',
     'calculate_relative_velocity',
     'heading_speed_to_velocity',
+    'heading_rad_speed_to_velocity',
     'velocity_to_heading_speed',
     'calculate_aspect_angle',
+    'calculate_bearing_rate',
+    'calculate_bearing_rate_batch',
     # coordinate_transform
     'ned_to_math_heading',
     'math_to_ned_heading',
+    'math_to_ned_heading_array',
     'maritime_to_math_position',
     'math_to_maritime_position',
     'maritime_to_math_state',
@@ -41,4 +52,6 @@ __all__ = [
     'math_relative_angle',
     'math_to_maritime_velocity',
     'maritime_to_math_velocity',
+    # kernels
+    'warmup_kernels',
 ]
@@ -0,0 +1,62 @@
+"""
+geometry.kernels의 batch 커널 AOT (ahead-of-time) 빌드 스크립트
+
+numba.pycc로 batch 커널을 미리 컴파일하여 geometry/_colregs_aot 확장 모듈을 만든다.
+빌드된 모듈이 있으면 kernels가 import 시점에 이를 사용하므로 첫 step에서
+JIT 컴파일/캐시 로드 지연이 없다. 없으면 기존 njit 커널을 그대로 사용한다.
+
+AOT 커널은 parallel=True를 지원하지 않아 prange 루프가 순차 실행된다
+(TS 수가 적은 시뮬레이션에서는 스레드 시작 비용이 없는 쪽이 유리하다).
+
+모듈에는 빌드 시점 kernels.py 소스 hash (source_stamp)가 함께 들어가며, kernels는
+현재 소스와 hash가 다르면 AOT 모듈을 무시하고 njit 커널로 돌아간다.
+
+numba.pycc는 numba에서 pending deprecation 상태이므로 (대체 AOT 도구 미정)
+numba 버전을 올릴 때 이 스크립트가 계속 동작하는지 확인할 것.
+
+사용법 (numba와 C 컴파일러 필요):
+    python -m colregs_core.geometry._aot_build
+"""
+import os
+
+from numba.pycc import CC
+
+from . import kernels
+
+
+def _signature(n_scalars_before, n_arrays, n_scalars_after=0, n_outputs=0):
+    """(scalar..., array..., scalar..., output array...) 순서의 void 시그니처 문자열"""
+    args = (["f8"] * n_scalars_before + ["f8[:]"] * n_arrays
+            + ["f8"] * n_scalars_after + ["f8[:]"] * n_outputs)
+    return f"void({', '.join(args)})"
+
+
+cc = CC('_colregs_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+_SOURCE_STAMP = kernels._source_stamp()
+
+
+@cc.export('source_stamp', 'i8()')
+def _aot_source_stamp():
+    """빌드 시점 kernels.py 소스 hash (컴파일 시 상수로 고정)"""
+    return _SOURCE_STAMP
+
+
+# 인자 순서는 kernels의 njit 커널과 동일
+cc.export('cpa_tcpa_batch', _signature(4, 4, n_outputs=3))(
+    kernels._cpa_tcpa_batch.py_func
+)
+cc.export('encounter_geometry_batch', _signature(3, 3, 1, n_outputs=4))(
+    kernels._encounter_geometry_batch.py_func
+)
+cc.export('full_encounter_batch', _signature(5, 5, n_outputs=7))(
+    kernels._full_encounter_batch.py_func
+)
+
+
+if __name__ == "__main__":
+    if _SOURCE_STAMP is None:
+        raise SystemExit("cannot read colregs_core/geometry/kernels.py to stamp the build")
+    cc.compile()
+    print(f"Built {cc.name} in {cc.output_dir}")
@@ -1,9 +1,11 @@
 """
 항해 기하학 계산 유틸리티 (Maritime/NED 좌표계 사용)
 """
+import math
 import numpy as np
 from typing import Tuple
-from ..utils import WrapTo180, WrapTo360
+from ..utils import WrapTo180, WrapTo360, WrapTo360Array
+from .kernels import _bearing_rate, _run_cpa_tcpa_batch
 
 def calculate_relative_bearing(
     os_position: Tuple[float, float],
@@ -44,13 +46,39 @@ def calculate_relative_bearing(
     # 절대 방위각 계산 (North=0, clockwise)
     # Maritime/NED 좌표계: atan2(dy_east, dx_north) 사용
     # atan2(East, North) gives angle from North, clockwise
-    absolute_bearing = np.degrees(np.arctan2(dy, dx))
+    absolute_bearing = math.degrees(math.atan2(dy, dx))
     
     # 상대 방위각 = 절대 방위각 - OS heading
     relative_bearing = WrapTo360(absolute_bearing - os_heading)
     
     return relative_bearing
 
+def calculate_relative_bearing_batch(
+    os_position: Tuple[float, float],
+    os_heading: float,
+    ts_positions: np.ndarray
+) -> np.ndarray:
+    """
+    다수 TS에 대한 상대 방위각 일괄 계산 (calculate_relative_bearing의 벡터화 버전)
+    
+    Args:
+        os_position: OS 위치 (x, y) in meters
+        os_heading: OS heading (degrees, 0=North, clockwise)
+        ts_positions: TS 위치 배열 (N, 2) in meters
+    
+    Returns:
+        상대 방위각 배열 (N,) degrees, [0, 360)
+    """
+    ts_positions = np.asarray(ts_positions, dtype=float).reshape(-1, 2)
+    dx = ts_positions[:, 0] - float(os_position[0])  # North
+    dy = ts_positions[:, 1] - float(os_position[1])  # East
+    # arctan2 결과 배열 하나를 degrees -> 상대 방위 -> [0, 360) 까지 in-place로 재사용
+    bearing = np.arctan2(dy, dx)
+    np.degrees(bearing, out=bearing)
+    np.subtract(bearing, os_heading, out=bearing)
+    WrapTo360Array(bearing, out=bearing)
+    return bearing
+
 def calculate_relative_velocity(
     os_velocity: Tuple[float, float],
     ts_velocity: Tuple[float, float]
@@ -79,14 +107,30 @@ def heading_speed_to_velocity(heading: float, speed: float) -> Tuple[float, floa
         heading: Heading (degrees, 0=North, clockwise)
         speed: 속도 (m/s or knots)
     
+    Returns:
+        속도 벡터 (vx, vy)
+    """
+    return heading_rad_speed_to_velocity(math.radians(heading), speed)
+
+
+def heading_rad_speed_to_velocity(heading_rad: float, speed: float) -> Tuple[float, float]:
+    """
+    Heading(radians)과 속도를 속도 벡터로 변환
+    
+    heading이 이미 radians인 경우 degrees 변환 없이 사용
+    
+    Args:
+        heading_rad: Heading (radians, 0=North, clockwise)
+        speed: 속도 (m/s or knots)
+    
     Returns:
         속도 벡터 (vx, vy)
     """
     # Maritime/NED 좌표계: vx=North, vy=East
     # heading=0°(North) → vx=speed, vy=0
     # heading=90°(East) → vx=0, vy=speed
-    vx = speed * np.cos(np.radians(heading))  # North component
-    vy = speed * np.sin(np.radians(heading))  # East component
+    vx = speed * math.cos(heading_rad)  # North component
+    vy = speed * math.sin(heading_rad)  # East component
     return (vx, vy)
 
 
@@ -103,9 +147,9 @@ def velocity_to_heading_speed(velocity: Tuple[float, float]) -> Tuple[float, flo
         speed: magnitude of velocity
     """
     vx, vy = velocity  # vx=North, vy=East
-    speed = np.sqrt(vx**2 + vy**2)
+    speed = math.hypot(vx, vy)
     # Maritime/NED 좌표계: atan2(vy_east, vx_north) 사용
-    heading = WrapTo180(np.degrees(np.arctan2(vy, vx)))
+    heading = WrapTo180(math.degrees(math.atan2(vy, vx)))
     return heading, speed
 
 def calculate_aspect_angle(
@@ -151,7 +195,60 @@ def calculate_aspect_angle(
     
     # Maritime/NED 좌표계: atan2(dy_east, dx_north) 사용
     # atan2(East, North) gives angle from North, clockwise
-    absolute_bearing = np.degrees(np.arctan2(dy, dx))
+    absolute_bearing = math.degrees(math.atan2(dy, dx))
     aspect = WrapTo360(absolute_bearing - ts_heading)
     
     return aspect
+
+
+def calculate_bearing_rate(
+    os_position: Tuple[float, float],
+    os_velocity: Tuple[float, float],
+    ts_position: Tuple[float, float],
+    ts_velocity: Tuple[float, float]
+) -> float:
+    """
+    OS에서 본 TS 방위의 변화율 계산
+    
+    방위 변화가 거의 없는 상태(constant bearing)에서 거리가 줄어들면
+    충돌 위험이 있는 것으로 판단한다.
+    
+    Args:
+        os_position: OS 위치 (x, y) in meters
+        os_velocity: OS 속도 벡터 (vx, vy) in m/s
+        ts_position: TS 위치 (x, y) in meters
+        ts_velocity: TS 속도 벡터 (vx, vy) in m/s
+    
+    Returns:
+        방위 변화율 (deg/s, 양수=시계방향)
+    """
+    return float(_bearing_rate(
+        float(ts_position[0]) - float(os_position[0]),
+        float(ts_position[1]) - float(os_position[1]),
+        float(ts_velocity[0]) - float(os_velocity[0]),
+        float(ts_velocity[1]) - float(os_velocity[1])
+    ))
+
+
+def calculate_bearing_rate_batch(
+    os_position: Tuple[float, float],
+    os_velocity: Tuple[float, float],
+    ts_positions: np.ndarray,
+    ts_velocities: np.ndarray
+) -> np.ndarray:
+    """
+    다수 TS에 대한 방위 변화율 일괄 계산 (calculate_bearing_rate의 벡터화 버전)
+    
+    Args:
+        os_position: OS 위치 (x, y) in meters
+        os_velocity: OS 속도 벡터 (vx, vy) in m/s
+        ts_positions: TS 위치 배열 (N, 2) in meters
+        ts_velocities: TS 속도 벡터 배열 (N, 2) in m/s
+    
+    Returns:
+        방위 변화율 배열 (N,) deg/s
+    """
+    _, _, bearing_rate = _run_cpa_tcpa_batch(
+        os_position, os_velocity, ts_positions, ts_velocities
+    )
+    return np.asarray(bearing_rate)
@@ -24,9 +24,9 @@ Date: 2025-10-27
 """
 
 import numpy as np
-from typing import Tuple
-from ..utils import WrapTo180, WrapTo360
-from math import pi, atan2, sin, cos, sqrt
+from typing import Tuple, Optional
+from ..utils import WrapTo180, WrapTo360, WrapTo180Array
+from math import pi, atan2, sin, cos, sqrt, degrees, radians
 
 # ========================================
 # Heading Conversion Functions  
@@ -57,6 +57,26 @@ def math_to_ned_heading(math_deg: float) -> float:
     """
     return WrapTo180(90.0 - math_deg)
 
+
+def math_to_ned_heading_array(math_deg: np.ndarray,
+                              out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Array version of `math_to_ned_heading`.
+    
+    Args:
+        math_deg: Headings in math coordinates (degrees, 0=East, CCW), shape (N,)
+        out: Optional output array (may be `math_deg` itself for in-place conversion)
+    
+    Returns:
+        Headings in NED coordinates (degrees, 0=North, CW), shape (N,)
+    """
+    math_deg = np.asarray(math_deg, dtype=float)
+    if out is None:
+        out = np.empty_like(math_deg)
+    np.subtract(90.0, math_deg, out=out)
+    WrapTo180Array(out, out=out)
+    return out
+
 # ========================================
 # Position / State Conversion Functions  
 # ========================================
@@ -151,7 +171,7 @@ def maritime_relative_angle(dx_north: float, dy_east: float) -> float:
     Returns:
         Angle in degrees [0, 360) from North, clockwise
     """
-    return WrapTo360(np.degrees(np.atan2(dy_east, dx_north)))
+    return WrapTo360(degrees(atan2(dy_east, dx_north)))
 
 
 def math_relative_angle(dx_east: float, dy_north: float) -> float:
@@ -165,7 +185,7 @@ def math_relative_angle(dx_east: float, dy_north: float) -> float:
     Returns:
         Angle in degrees [0, 360) from East, counter-clockwise
     """
-    return WrapTo360(np.degrees(np.atan2(dy_north, dx_east)))
+    return WrapTo360(degrees(atan2(dy_north, dx_east)))
 
 # ========================================
 # Velocity Conversion Functions  
@@ -182,9 +202,9 @@ def math_to_maritime_velocity(math_deg: float, speed: float) -> Tuple[float, flo
     Returns:
         (vx_north, vy_east) velocity components in NED coordinates
     """
-    heading_rad = np.radians(math_deg)
-    vx_north = speed * np.sin(heading_rad)
-    vy_east = speed * np.cos(heading_rad)
+    heading_rad = radians(math_deg)
+    vx_north = speed * sin(heading_rad)
+    vy_east = speed * cos(heading_rad)
     return (vx_north, vy_east)
 
 
@@ -199,9 +219,9 @@ def maritime_to_math_velocity(maritime_deg: float, speed: float) -> Tuple[float,
     Returns:
         (vx_east, vy_north) velocity components in math coordinates
     """
-    heading_rad = np.radians(maritime_deg)
-    vx_east = speed * np.sin(heading_rad)
-    vy_north = speed * np.cos(heading_rad)
+    heading_rad = radians(maritime_deg)
+    vx_east = speed * sin(heading_rad)
+    vy_north = speed * cos(heading_rad)
     return (vx_east, vy_north)
 
 # ========================================
@@ -0,0 +1,562 @@
+"""
+CPA/TCPA 및 방위 변화율 계산 커널 (Maritime/NED 좌표계)
+
+float 인자만 받는 순수 산술 함수로 작성하여 numba.njit으로 컴파일한다.
+numba가 없으면 scalar 커널은 같은 함수가 Python으로 실행되고 (utils.jit 참고),
+batch 커널은 TS별 Python loop 대신 같은 출력 규약의 NumPy 배열 연산 버전을 사용한다.
+공개 API는 geometry.bearings / risk.cpa_tcpa의 wrapper 함수를 사용한다.
+"""
+import hashlib
+import math
+import warnings
+
+import numpy as np
+
+from ..utils import WrapTo360Array
+from ..utils.jit import NUMBA_AVAILABLE, njit, prange
+
+_RAD2DEG = 180.0 / math.pi
+
+# TS 수가 이 값 이하이면 batch wrapper가 parallel 커널 대신 단일 스레드 커널을 사용
+# (prange의 스레드 pool dispatch 비용이 계산량보다 큰 구간)
+_SERIAL_MAX_TARGETS = 8
+
+
+@njit(cache=True, fastmath=True)
+def _cpa_tcpa(dx, dy, dvx, dvy):
+    """
+    상대 위치 (P_O - P_T)와 상대 속도 (V_O - V_T)로부터 (dcpa, tcpa) 계산
+    
+    상대 속도가 0이면 TCPA = 0, DCPA = 현재 거리 (Paper Eq. 1)
+    """
+    rel_speed_sq = dvx * dvx + dvy * dvy
+    if rel_speed_sq < 1e-6:
+        return math.sqrt(dx * dx + dy * dy), 0.0
+
+    # DCPA = |P x V| / |V| (CPA 위치를 구하지 않는 closed form)
+    tcpa = -(dx * dvx + dy * dvy) / rel_speed_sq
+    return abs(dx * dvy - dy * dvx) / math.sqrt(rel_speed_sq), tcpa
+
+
+@njit(cache=True, fastmath=True)
+def _bearing_rate(dx, dy, dvx, dvy):
+    """
+    상대 위치 (P_T - P_O)와 상대 속도 (V_T - V_O)로부터 방위 변화율 (deg/s) 계산
+    
+    양수 = 방위가 시계방향으로 증가. 두 선박이 겹쳐 있으면 0.
+    """
+    r_sq = dx * dx + dy * dy
+    if r_sq < 1e-6:
+        return 0.0
+    return (dx * dvy - dy * dvx) / r_sq * _RAD2DEG
+
+
+@njit(cache=True, fastmath=True)
+def _cpa_tcpa_bearing_rate(dx, dy, dvx, dvy):
+    """
+    _cpa_tcpa와 _bearing_rate를 한 번에 계산 (외적 dx*dvy - dy*dvx 공유)
+    
+    상대 위치/속도의 부호를 모두 바꿔도 결과가 같으므로
+    (P_O - P_T, V_O - V_T)와 (P_T - P_O, V_T - V_O) 어느 쪽이든 사용 가능
+    
+    Returns:
+        (dcpa, tcpa, bearing_rate)
+    """
+    cross = dx * dvy - dy * dvx
+    r_sq = dx * dx + dy * dy
+    bearing_rate = 0.0 if r_sq < 1e-6 else cross / r_sq * _RAD2DEG
+
+    rel_speed_sq = dvx * dvx + dvy * dvy
+    if rel_speed_sq < 1e-6:
+        return math.sqrt(r_sq), 0.0, bearing_rate
+    tcpa = -(dx * dvx + dy * dvy) / rel_speed_sq
+    return abs(cross) / math.sqrt(rel_speed_sq), tcpa, bearing_rate
+
+
+@njit(cache=True, fastmath=True)
+def _wrap_to_360(deg):
+    """
+    커널 내부용 utils.WrapTo360 (0°/360° 근처 1e-6 이내는 0°로 정규화)
+    """
+    # numba는 math.fmod를 지원하지 않으므로 Python의 % (결과 부호 = 제수 부호) 사용
+    deg = deg % 360.0
+    if deg < 1e-6 or 360.0 - deg < 1e-6:
+        return 0.0
+    return deg
+
+
+@njit(cache=True, fastmath=True)
+def _encounter_geometry(os_x, os_y, os_hdg_deg, ts_x, ts_y, ts_hdg_deg):
+    """
+    OS-TS 한 쌍의 (distance, relative_bearing, aspect_angle) 계산
+    
+    relative_bearing: OS 선수 기준 TS 방위 (degrees, [0, 360))
+    aspect_angle: TS 선수 기준 OS 방위 (degrees, [0, 360))
+    """
+    dx = ts_x - os_x  # North
+    dy = ts_y - os_y  # East
+    dist = math.sqrt(dx * dx + dy * dy)
+    true_bearing = math.atan2(dy, dx) * _RAD2DEG
+    rel_bearing = _wrap_to_360(true_bearing - os_hdg_deg)
+    if dx == 0.0 and dy == 0.0:
+        # 두 선박 위치가 같으면 180° 회전이 성립하지 않으므로
+        # calculate_aspect_angle과 같이 atan2(0, 0) = 0 기준으로 계산
+        aspect = _wrap_to_360(-ts_hdg_deg)
+    else:
+        # TS -> OS 방위는 OS -> TS의 반대 방향 (atan2를 다시 호출하지 않고 180° 회전)
+        aspect = _wrap_to_360(true_bearing + 180.0 - ts_hdg_deg)
+    return dist, rel_bearing, aspect
+
+
+@njit(cache=True, fastmath=True)
+def _full_encounter(os_x, os_y, os_vx, os_vy, os_hdg_deg,
+                    ts_x, ts_y, ts_vx, ts_vy, ts_hdg_deg):
+    """
+    OS-TS 한 쌍의 조우 기하량을 한 번에 계산
+    
+    classify (거리/방위/aspect)와 CR 계산 (DCPA/TCPA/방위 변화율)이
+    같은 상대 위치·속도를 다시 읽지 않도록 하나로 묶은 커널
+    
+    Returns:
+        (dist, rel_bearing, aspect, dcpa, tcpa, bearing_rate)
+    """
+    dist, rel_bearing, aspect = _encounter_geometry(
+        os_x, os_y, os_hdg_deg, ts_x, ts_y, ts_hdg_deg
+    )
+    dx = ts_x - os_x
+    dy = ts_y - os_y
+    dvx = ts_vx - os_vx
+    dvy = ts_vy - os_vy
+    dcpa, tcpa, bearing_rate = _cpa_tcpa_bearing_rate(dx, dy, dvx, dvy)
+    return dist, rel_bearing, aspect, dcpa, tcpa, bearing_rate
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _cpa_tcpa_batch(os_x, os_y, os_vx, os_vy, ts_x, ts_y, ts_vx, ts_vy,
+                    dcpa_out, tcpa_out, bearing_rate_out):
+    """
+    N개 TS에 대한 (dcpa, tcpa, bearing_rate)를 출력 배열에 기록
+    
+    ts_* 및 *_out은 길이 N의 float64 배열
+    """
+    for i in prange(ts_x.shape[0]):
+        dx = os_x - ts_x[i]
+        dy = os_y - ts_y[i]
+        dvx = os_vx - ts_vx[i]
+        dvy = os_vy - ts_vy[i]
+        dcpa, tcpa, bearing_rate = _cpa_tcpa_bearing_rate(dx, dy, dvx, dvy)
+        dcpa_out[i] = dcpa
+        tcpa_out[i] = tcpa
+        bearing_rate_out[i] = bearing_rate
+
+
+def _cpa_tcpa_bearing_rate_array(dx, dy, dvx, dvy):
+    """
+    _cpa_tcpa_bearing_rate의 NumPy 배열 버전 (numba 미설치 시 batch 경로용)
+    
+    Returns:
+        (dcpa, tcpa, bearing_rate) - 입력과 같은 shape의 배열
+    """
+    cross = dx * dvy - dy * dvx
+    r_sq = dx * dx + dy * dy
+    rel_speed_sq = dvx * dvx + dvy * dvy
+    overlap = r_sq < 1e-6
+    no_rel_motion = rel_speed_sq < 1e-6
+    
+    # 0으로 나누지 않도록 분모를 1로 바꿔 계산한 뒤 scalar 커널의 예외값으로 덮어씀
+    bearing_rate = cross / np.where(overlap, 1.0, r_sq) * _RAD2DEG
+    bearing_rate[overlap] = 0.0
+    
+    rel_speed_sq = np.where(no_rel_motion, 1.0, rel_speed_sq)
+    dcpa = np.abs(cross) / np.sqrt(rel_speed_sq)
+    tcpa = -(dx * dvx + dy * dvy) / rel_speed_sq
+    dcpa[no_rel_motion] = np.sqrt(r_sq[no_rel_motion])
+    tcpa[no_rel_motion] = 0.0
+    return dcpa, tcpa, bearing_rate
+
+
+def _cpa_tcpa_batch_numpy(os_x, os_y, os_vx, os_vy, ts_x, ts_y, ts_vx, ts_vy,
+                          dcpa_out, tcpa_out, bearing_rate_out):
+    """
+    _cpa_tcpa_batch의 NumPy 버전 (같은 인자/출력 배열 규약)
+    """
+    dcpa_out[:], tcpa_out[:], bearing_rate_out[:] = _cpa_tcpa_bearing_rate_array(
+        os_x - ts_x, os_y - ts_y, os_vx - ts_vx, os_vy - ts_vy
+    )
+
+
+def _encounter_angles_array(dx, dy, os_hdg_deg, ts_hdg_deg):
+    """
+    _encounter_geometry의 각도 계산과 상대 침로의 NumPy 배열 버전
+    (numba 미설치 시 batch 경로용)
+    
+    Args:
+        dx, dy: TS - OS 상대 위치 배열 (North, East)
+        os_hdg_deg: OS heading (degrees)
+        ts_hdg_deg: TS heading 배열 (degrees)
+    
+    Returns:
+        (relative_bearing, relative_course, aspect) - [0, 360) 배열
+    """
+    true_bearing = np.arctan2(dy, dx) * _RAD2DEG
+    rel_bearing = true_bearing - os_hdg_deg
+    WrapTo360Array(rel_bearing, out=rel_bearing)
+    rel_course = WrapTo360Array(ts_hdg_deg - os_hdg_deg)
+    # 두 선박 위치가 같으면 _encounter_geometry와 같이 atan2(0, 0) = 0 기준
+    coincident = (dx == 0.0) & (dy == 0.0)
+    aspect = np.where(coincident, 0.0, true_bearing + 180.0) - ts_hdg_deg
+    WrapTo360Array(aspect, out=aspect)
+    return rel_bearing, rel_course, aspect
+
+
+@njit(cache=True, fastmath=True)
+def _encounter_geometry_row(i, os_x, os_y, os_hdg_deg, ts_x, ts_y, ts_hdg_deg, safe_distance,
+                            dist_out, rel_bearing_out, rel_course_out, aspect_out):
+    """
+    _encounter_geometry_batch의 i번째 TS 계산 (parallel/serial 커널 공용 loop body)
+    
+    safe_distance 밖의 TS는 EncounterClassifier.classify와 같이 각도를 0으로 채운다.
+    이 경우 거리 비교만 하고 atan2/wrap 계산은 건너뛴다.
+    """
+    dx = ts_x[i] - os_x
+    dy = ts_y[i] - os_y
+    dist_sq = dx * dx + dy * dy
+    if dist_sq > safe_distance * safe_distance:
+        dist_out[i] = math.sqrt(dist_sq)
+        rel_bearing_out[i] = 0.0
+        rel_course_out[i] = 0.0
+        aspect_out[i] = 0.0
+        return
+    
+    dist, rel_bearing, aspect = _encounter_geometry(
+        os_x, os_y, os_hdg_deg, ts_x[i], ts_y[i], ts_hdg_deg[i]
+    )
+    dist_out[i] = dist
+    rel_bearing_out[i] = rel_bearing
+    rel_course_out[i] = _wrap_to_360(ts_hdg_deg[i] - os_hdg_deg)
+    aspect_out[i] = aspect
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _encounter_geometry_batch(os_x, os_y, os_hdg_deg, ts_x, ts_y, ts_hdg_deg, safe_distance,
+                              dist_out, rel_bearing_out, rel_course_out, aspect_out):
+    """
+    N개 TS에 대한 (distance, relative_bearing, relative_course, aspect)를 출력 배열에 기록
+    
+    safe_distance 밖의 TS는 EncounterClassifier.classify와 같이 각도를 0으로 채운다.
+    """
+    for i in prange(ts_x.shape[0]):
+        _encounter_geometry_row(i, os_x, os_y, os_hdg_deg, ts_x, ts_y, ts_hdg_deg, safe_distance,
+                                dist_out, rel_bearing_out, rel_course_out, aspect_out)
+
+
+@njit(cache=True, fastmath=True)
+def _encounter_geometry_batch_serial(os_x, os_y, os_hdg_deg, ts_x, ts_y, ts_hdg_deg,
+                                     safe_distance, dist_out, rel_bearing_out,
+                                     rel_course_out, aspect_out):
+    """
+    _encounter_geometry_batch의 단일 스레드 버전 (TS가 적을 때 스레드 dispatch 비용 없음)
+    """
+    for i in range(ts_x.shape[0]):
+        _encounter_geometry_row(i, os_x, os_y, os_hdg_deg, ts_x, ts_y, ts_hdg_deg, safe_distance,
+                                dist_out, rel_bearing_out, rel_course_out, aspect_out)
+
+
+def _encounter_geometry_batch_numpy(os_x, os_y, os_hdg_deg, ts_x, ts_y, ts_hdg_deg,
+                                    safe_distance, dist_out, rel_bearing_out,
+                                    rel_course_out, aspect_out):
+    """
+    _encounter_geometry_batch의 NumPy 버전 (같은 인자/출력 배열 규약)
+    
+    각도 계산은 safe_distance 안의 TS에 대해서만 수행한다.
+    """
+    dx = ts_x - os_x
+    dy = ts_y - os_y
+    dist_sq = dx * dx + dy * dy
+    np.sqrt(dist_sq, out=dist_out)
+    
+    rel_bearing_out[:] = 0.0
+    rel_course_out[:] = 0.0
+    aspect_out[:] = 0.0
+    near = ~(dist_sq > safe_distance * safe_distance)
+    if near.any():
+        (rel_bearing_out[near], rel_course_out[near], aspect_out[near]) = (
+            _encounter_angles_array(dx[near], dy[near], os_hdg_deg, ts_hdg_deg[near])
+        )
+
+
+def _run_encounter_geometry_batch(os_position, os_heading, ts_positions, ts_headings,
+                                  safe_distance):
+    """
+    _encounter_geometry_batch 호출 wrapper
+    
+    Args:
+        os_position: OS 위치 (x, y)
+        os_heading: OS heading (degrees)
+        ts_positions: TS 위치 배열 (N, 2)
+        ts_headings: TS heading 배열 (N,) degrees
+        safe_distance: 안전 거리 (meters)
+    
+    Returns:
+        (distance, relative_bearing, relative_course, aspect_angle) - 길이 N 배열
+    """
+    n = ts_positions.shape[0]
+    distance = np.empty(n)
+    relative_bearing = np.empty(n)
+    relative_course = np.empty(n)
+    aspect_angle = np.empty(n)
+    kernel = (_encounter_geometry_batch_serial_impl if n <= _SERIAL_MAX_TARGETS
+              else _encounter_geometry_batch_impl)
+    kernel(
+        float(os_position[0]), float(os_position[1]), float(os_heading),
+        np.ascontiguousarray(ts_positions[:, 0]), np.ascontiguousarray(ts_positions[:, 1]),
+        np.ascontiguousarray(ts_headings), float(safe_distance),
+        distance, relative_bearing, relative_course, aspect_angle
+    )
+    return distance, relative_bearing, relative_course, aspect_angle
+
+
+@njit(cache=True, fastmath=True)
+def _full_encounter_row(i, os_x, os_y, os_vx, os_vy, os_hdg_deg,
+                        ts_x, ts_y, ts_vx, ts_vy, ts_hdg_deg,
+                        dist_out, rel_bearing_out, rel_course_out, aspect_out,
+                        dcpa_out, tcpa_out, bearing_rate_out):
+    """
+    _full_encounter_batch의 i번째 TS 계산 (parallel/serial 커널 공용 loop body)
+    """
+    dist, rel_bearing, aspect, dcpa, tcpa, bearing_rate = _full_encounter(
+        os_x, os_y, os_vx, os_vy, os_hdg_deg,
+        ts_x[i], ts_y[i], ts_vx[i], ts_vy[i], ts_hdg_deg[i]
+    )
+    dist_out[i] = dist
+    rel_bearing_out[i] = rel_bearing
+    rel_course_out[i] = _wrap_to_360(ts_hdg_deg[i] - os_hdg_deg)
+    aspect_out[i] = aspect
+    dcpa_out[i] = dcpa
+    tcpa_out[i] = tcpa
+    bearing_rate_out[i] = bearing_rate
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _full_encounter_batch(os_x, os_y, os_vx, os_vy, os_hdg_deg,
+                          ts_x, ts_y, ts_vx, ts_vy, ts_hdg_deg,
+                          dist_out, rel_bearing_out, rel_course_out, aspect_out,
+                          dcpa_out, tcpa_out, bearing_rate_out):
+    """
+    N개 TS에 대해 _full_encounter와 상대 침로를 한 번에 계산하여 출력 배열에 기록
+    
+    분류(classify)와 CR 계산이 같은 (dx, dy, dvx, dvy)를 한 번만 읽도록 하는 커널.
+    안전 거리 마스킹은 하지 않는다 (CR 결과의 relative_bearing은 항상 실제 값).
+    """
+    for i in prange(ts_x.shape[0]):
+        _full_encounter_row(i, os_x, os_y, os_vx, os_vy, os_hdg_deg,
+                            ts_x, ts_y, ts_vx, ts_vy, ts_hdg_deg,
+                            dist_out, rel_bearing_out, rel_course_out, aspect_out,
+                            dcpa_out, tcpa_out, bearing_rate_out)
+
+
+@njit(cache=True, fastmath=True)
+def _full_encounter_batch_serial(os_x, os_y, os_vx, os_vy, os_hdg_deg,
+                                 ts_x, ts_y, ts_vx, ts_vy, ts_hdg_deg,
+                                 dist_out, rel_bearing_out, rel_course_out, aspect_out,
+                                 dcpa_out, tcpa_out, bearing_rate_out):
+    """
+    _full_encounter_batch의 단일 스레드 버전 (TS가 적을 때 스레드 dispatch 비용 없음)
+    """
+    for i in range(ts_x.shape[0]):
+        _full_encounter_row(i, os_x, os_y, os_vx, os_vy, os_hdg_deg,
+                            ts_x, ts_y, ts_vx, ts_vy, ts_hdg_deg,
+                            dist_out, rel_bearing_out, rel_course_out, aspect_out,
+                            dcpa_out, tcpa_out, bearing_rate_out)
+
+
+def _full_encounter_batch_numpy(os_x, os_y, os_vx, os_vy, os_hdg_deg,
+                                ts_x, ts_y, ts_vx, ts_vy, ts_hdg_deg,
+                                dist_out, rel_bearing_out, rel_course_out, aspect_out,
+                                dcpa_out, tcpa_out, bearing_rate_out):
+    """
+    _full_encounter_batch의 NumPy 버전 (같은 인자/출력 배열 규약)
+    """
+    dx = ts_x - os_x
+    dy = ts_y - os_y
+    np.sqrt(dx * dx + dy * dy, out=dist_out)
+    rel_bearing_out[:], rel_course_out[:], aspect_out[:] = _encounter_angles_array(
+        dx, dy, os_hdg_deg, ts_hdg_deg
+    )
+    dcpa_out[:], tcpa_out[:], bearing_rate_out[:] = _cpa_tcpa_bearing_rate_array(
+        dx, dy, ts_vx - os_vx, ts_vy - os_vy
+    )
+
+
+def _run_full_encounter_batch(os_position, os_velocity, os_heading,
+                              ts_positions, ts_velocities, ts_headings):
+    """
+    _full_encounter_batch 호출 wrapper
+    
+    Args:
+        os_position, os_velocity: OS 위치/속도 (x, y)
+        os_heading: OS heading (degrees)
+        ts_positions, ts_velocities: TS 위치/속도 배열 (N, 2)
+        ts_headings: TS heading 배열 (N,) degrees
+    
+    Returns:
+        (distance, relative_bearing, relative_course, aspect_angle,
+         dcpa, tcpa, bearing_rate) - 길이 N 배열
+    """
+    ts_positions = np.asarray(ts_positions, dtype=np.float64).reshape(-1, 2)
+    ts_velocities = np.asarray(ts_velocities, dtype=np.float64).reshape(-1, 2)
+    ts_headings = np.asarray(ts_headings, dtype=np.float64).reshape(-1)
+    n = ts_positions.shape[0]
+    if ts_velocities.shape[0] != n or ts_headings.shape[0] != n:
+        raise ValueError(
+            f"ts_positions, ts_velocities and ts_headings must have the same length. "
+            f"Got {n}, {ts_velocities.shape[0]}, {ts_headings.shape[0]}"
+        )
+
+    out = tuple(np.empty(n) for _ in range(7))
+    kernel = (_full_encounter_batch_serial_impl if n <= _SERIAL_MAX_TARGETS
+              else _full_encounter_batch_impl)
+    kernel(
+        float(os_position[0]), float(os_position[1]),
+        float(os_velocity[0]), float(os_velocity[1]), float(os_heading),
+        np.ascontiguousarray(ts_positions[:, 0]), np.ascontiguousarray(ts_positions[:, 1]),
+        np.ascontiguousarray(ts_velocities[:, 0]), np.ascontiguousarray(ts_velocities[:, 1]),
+        np.ascontiguousarray(ts_headings),
+        *out
+    )
+    return out
+
+
+def _run_cpa_tcpa_batch(os_position, os_velocity, ts_positions, ts_velocities):
+    """
+    _cpa_tcpa_batch 호출 wrapper
+    
+    Args:
+        os_position, os_velocity: OS 위치/속도 (x, y)
+        ts_positions, ts_velocities: TS 위치/속도 배열 (N, 2)
+    
+    Returns:
+        (dcpa, tcpa, bearing_rate) - 길이 N 배열
+    """
+    ts_positions = np.asarray(ts_positions, dtype=np.float64).reshape(-1, 2)
+    ts_velocities = np.asarray(ts_velocities, dtype=np.float64).reshape(-1, 2)
+    n = ts_positions.shape[0]
+    if ts_velocities.shape[0] != n:
+        raise ValueError(
+            f"ts_positions and ts_velocities must have the same length. "
+            f"Got {n}, {ts_velocities.shape[0]}"
+        )
+
+    dcpa = np.empty(n)
+    tcpa = np.empty(n)
+    bearing_rate = np.empty(n)
+    _cpa_tcpa_batch_impl(
+        float(os_position[0]), float(os_position[1]),
+        float(os_velocity[0]), float(os_velocity[1]),
+        np.ascontiguousarray(ts_positions[:, 0]), np.ascontiguousarray(ts_positions[:, 1]),
+        np.ascontiguousarray(ts_velocities[:, 0]), np.ascontiguousarray(ts_velocities[:, 1]),
+        dcpa, tcpa, bearing_rate
+    )
+    return dcpa, tcpa, bearing_rate
+
+
+def _run_cpa_tcpa_relative(rel_x, rel_y, rel_vx, rel_vy):
+    """
+    임의 shape의 상대 위치/속도 배열에 대한 _cpa_tcpa_batch 호출 wrapper
+    
+    OS를 원점에 정지한 선박으로 두고 상대 상태를 TS 상태로 넘겨, 한 번의
+    커널 호출로 DCPA와 TCPA를 함께 계산한다 (상대 상태의 부호는 결과와 무관).
+    
+    Returns:
+        (dcpa, tcpa) - 입력을 broadcast한 shape의 배열
+    """
+    rel = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64) for value in (rel_x, rel_y, rel_vx, rel_vy))
+    )
+    shape = rel[0].shape
+    dcpa = np.empty(rel[0].size)
+    tcpa = np.empty(rel[0].size)
+    bearing_rate = np.empty(rel[0].size)
+    _cpa_tcpa_batch_impl(
+        0.0, 0.0, 0.0, 0.0,
+        *(np.ascontiguousarray(value).reshape(-1) for value in rel),
+        dcpa, tcpa, bearing_rate
+    )
+    return dcpa.reshape(shape), tcpa.reshape(shape)
+
+
+def _source_stamp():
+    """
+    이 파일 소스의 SHA-256 앞 15자리 (int64 범위 정수)
+    
+    _aot_build가 AOT 모듈에 같은 값을 박아 넣으며, 커널 소스가 바뀐 뒤 남아 있는
+    예전 빌드를 감지하는 데 사용한다. 소스를 읽을 수 없으면 None.
+    """
+    try:
+        with open(__file__, 'rb') as f:
+            return int(hashlib.sha256(f.read()).hexdigest()[:15], 16)
+    except OSError:
+        return None
+
+
+# python -m colregs_core.geometry._aot_build로 만든 AOT 모듈이 있으면 batch 커널을
+# 미리 컴파일된 버전으로 교체한다 (JIT 컴파일/캐시 로드 없음). 없으면 njit 커널,
+# numba도 없으면 NumPy 버전을 사용한다.
+try:
+    from . import _colregs_aot  # type: ignore[attr-defined]
+except ImportError:
+    _colregs_aot = None
+
+if _colregs_aot is not None:
+    # 빌드 이후 커널 소스가 바뀌었으면 (또는 stamp가 없는 예전 빌드면) 사용하지 않음
+    _aot_stamp = getattr(_colregs_aot, 'source_stamp', None)
+    if _aot_stamp is None or _aot_stamp() != _source_stamp():
+        warnings.warn(
+            f"{_colregs_aot.__file__} was built from a different version of "
+            "colregs_core.geometry.kernels and is ignored; rebuild it with "
+            "`python -m colregs_core.geometry._aot_build` or delete it.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        _colregs_aot = None
+
+if _colregs_aot is not None:
+    # AOT 커널은 원래 단일 스레드이므로 N과 무관하게 같은 커널 사용
+    _cpa_tcpa_batch_impl = _colregs_aot.cpa_tcpa_batch
+    _encounter_geometry_batch_impl = _colregs_aot.encounter_geometry_batch
+    _encounter_geometry_batch_serial_impl = _encounter_geometry_batch_impl
+    _full_encounter_batch_impl = _colregs_aot.full_encounter_batch
+    _full_encounter_batch_serial_impl = _full_encounter_batch_impl
+elif NUMBA_AVAILABLE:
+    _cpa_tcpa_batch_impl = _cpa_tcpa_batch
+    _encounter_geometry_batch_impl = _encounter_geometry_batch
+    _encounter_geometry_batch_serial_impl = _encounter_geometry_batch_serial
+    _full_encounter_batch_impl = _full_encounter_batch
+    _full_encounter_batch_serial_impl = _full_encounter_batch_serial
+else:
+    # Python loop와 NumPy의 atan2 결과가 ulp 단위로 다를 수 있으므로
+    # TS 수와 무관하게 같은 NumPy 커널 사용 (결과가 N에 따라 바뀌지 않도록)
+    _cpa_tcpa_batch_impl = _cpa_tcpa_batch_numpy
+    _encounter_geometry_batch_impl = _encounter_geometry_batch_numpy
+    _encounter_geometry_batch_serial_impl = _encounter_geometry_batch_numpy
+    _full_encounter_batch_impl = _full_encounter_batch_numpy
+    _full_encounter_batch_serial_impl = _full_encounter_batch_numpy
+
+
+def warmup_kernels():
+    """
+    모든 커널을 더미 입력으로 한 번씩 호출하여 미리 컴파일
+    
+    numba가 있으면 첫 호출 시 JIT 컴파일 (cache=True면 디스크 캐시 로드)이
+    일어나므로, 테스트 fixture나 시뮬레이션 시작 시점에 호출해 두면 이후
+    step에서 컴파일 지연이 발생하지 않는다. numba가 없으면 비용이 거의 없다.
+    """
+    _full_encounter(0.0, 0.0, 1.0, 0.0, 0.0, 100.0, 50.0, -1.0, 0.0, 180.0)
+    # 단일 스레드 / parallel 커널을 모두 컴파일하도록 두 가지 TS 수로 호출
+    for n in (2, _SERIAL_MAX_TARGETS + 1):
+        ts = np.linspace(-50.0, 100.0, n)
+        ts_positions = np.stack([ts, ts], axis=1)
+        ts_velocities = np.zeros((n, 2))
+        _run_cpa_tcpa_batch((0.0, 0.0), (1.0, 0.0), ts_positions, ts_velocities)
+        _run_encounter_geometry_batch((0.0, 0.0), 0.0, ts_positions, ts, 80.0)
+        _run_full_encounter_batch((0.0, 0.0), (1.0, 0.0), 0.0, ts_positions, ts_velocities, ts)
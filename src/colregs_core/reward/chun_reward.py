@@ -7,6 +7,7 @@ for an autonomous ship." Ocean Engineering 234 (2021) 109216
 - Chun et al. (2024). "Method for collision avoidance based on deep reinforcement learning 
 with path-speed control for an autonomous ship." IJNAOE 16 (2024) 100579
 """
+import math
 import numpy as np
 from typing import Tuple, Optional, Dict, List
 from ..risk import JeonCollisionRisk, ChunCollisionRisk, ShipDomainParams
@@ -242,7 +243,7 @@ class ChunRewardCalculator:
         # Calculate distance from next OS position to check point
         dx = next_os_position[0] - check_point_position[0]
         dy = next_os_position[1] - check_point_position[1]
-        distance_to_checkpoint = np.sqrt(dx**2 + dy**2)
+        distance_to_checkpoint = math.hypot(dx, dy)
         
         # Base reward magnitude
         reward_magnitude = sailing_distance_between_checkpoints / (os_speed * self.dt)
@@ -4,7 +4,7 @@ COLREGs 규칙에 따른 올바른 회피 기동을 수행하는지 평가하는
 import numpy as np
 from typing import Tuple, Optional, Dict
 from ..encounter.types import EncounterType
-from ..utils import ref_course_angle, WrapTo180, WrapTo360
+from ..utils import ref_course_angle, WrapTo180, WrapTo360, extract_xy
 
 
 class ColregsCompliant:
@@ -26,6 +26,27 @@ class ColregsCompliant:
         self.standon_threshold = standon_threshold
         self.tcpa_threshold = tcpa_threshold
         self.static_threshold = static_threshold
+        
+        # ref_course_angle 캐시 (start/goal이 바뀔 때만 다시 계산)
+        self._ref_course_key: Optional[Tuple[float, float, float, float]] = None
+        self._ref_course_value = 0.0
+
+    def _ref_course(
+        self,
+        start_position: Tuple[float, float],
+        goal_position: Tuple[float, float],
+    ) -> float:
+        """
+        start -> goal 기준 침로 (χ_path, degrees)
+        
+        한 episode 동안 start/goal은 고정이므로 마지막 결과를 저장해 두고
+        start/goal이 바뀔 때만 ref_course_angle을 다시 계산한다.
+        """
+        key = (*extract_xy(start_position), *extract_xy(goal_position))
+        if key != self._ref_course_key:
+            self._ref_course_key = key
+            self._ref_course_value = ref_course_angle(start_position, goal_position)
+        return self._ref_course_value
 
     def is_compliant(
         self,
@@ -74,7 +95,7 @@ class ColregsCompliant:
         Returns:
             True if course angle change ≥ 30° to starboard
         """
-        ref_course = ref_course_angle(start_position, goal_position)  # Return degrees
+        ref_course = self._ref_course(start_position, goal_position)  # Return degrees
         # χ^avoid: course angle change from reference path
         # Use WrapTo180 to distinguish starboard (+) from port (-)
         course_angle = WrapTo180(os_heading - ref_course)
@@ -103,7 +124,7 @@ class ColregsCompliant:
         Returns:
             True if course angle change ≥ 75° to starboard
         """
-        ref_course = ref_course_angle(start_position, goal_position)
+        ref_course = self._ref_course(start_position, goal_position)
         # χ^avoid: course angle change from reference path
         # Use WrapTo180 to distinguish starboard (+) from port (-)
         course_angle = WrapTo180(os_heading - ref_course)
@@ -170,7 +191,7 @@ class ColregsCompliant:
         Returns:
             True if |course angle change| ≥ 45° (either direction)
         """
-        ref_course = ref_course_angle(start_position, goal_position)
+        ref_course = self._ref_course(start_position, goal_position)
         # χ^avoid: course angle change from reference path
         # Use WrapTo180 to get proper angle difference [-180, 180]
         course_angle = WrapTo180(os_heading - ref_course)
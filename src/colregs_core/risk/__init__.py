@@ -8,21 +8,29 @@ Risk Assessment Module
 """
 
 from .cpa_tcpa import (
-    calculate_cpa_tcpa
+    calculate_cpa_tcpa,
+    calculate_cpa_tcpa_batch,
+    calculate_cpa_tcpa_relative,
 )
 
 from .ship_domain import (
     ShipDomainParams,
     ChunCollisionRisk,
     JeonCollisionRisk,
+    select_most_dangerous,
+    collision_risk_table,
 )
 
 __all__ = [
     # CPA/TCPA functions
     'calculate_cpa_tcpa',
+    'calculate_cpa_tcpa_batch',
+    'calculate_cpa_tcpa_relative',
     
     # Ship Domain classes and functions
     'ShipDomainParams',
     'ChunCollisionRisk',
-    'JeonCollisionRisk'
+    'JeonCollisionRisk',
+    'select_most_dangerous',
+    'collision_risk_table',
 ]
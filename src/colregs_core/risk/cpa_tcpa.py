@@ -4,6 +4,9 @@ Closest Point of Approach (CPA) 및 Time to CPA (TCPA) 계산
 import numpy as np
 from typing import Tuple, Optional
 
+from ..utils import extract_xy
+from ..geometry.kernels import _cpa_tcpa, _run_cpa_tcpa_batch, _run_cpa_tcpa_relative
+
 
 def calculate_cpa_tcpa(
     os_position: Tuple[float, float],
@@ -44,45 +47,60 @@ def calculate_cpa_tcpa(
         - TCPA = 0: 현재가 CPA 시점 (평행 이동, 거리 일정)
     """
     # Extract scalar values from numpy arrays or tuples
-    def extract_coords(pos):
-        if isinstance(pos, np.ndarray):
-            if pos.ndim == 1:
-                return float(pos[0]), float(pos[1])
-            else:
-                return float(pos[0, 0]), float(pos[1, 0])
-        else:
-            return float(pos[0]), float(pos[1])
-    
-    os_x, os_y = extract_coords(os_position)
-    ts_x, ts_y = extract_coords(ts_position)
-    os_vx, os_vy = extract_coords(os_velocity)
-    ts_vx, ts_vy = extract_coords(ts_velocity)
+    os_x, os_y = extract_xy(os_position)
+    ts_x, ts_y = extract_xy(ts_position)
+    os_vx, os_vy = extract_xy(os_velocity)
+    ts_vx, ts_vy = extract_xy(ts_velocity)
     
-    # 상대 위치 벡터: P_O - P_T
-    dx = os_x - ts_x
-    dy = os_y - ts_y
+    # 상대 위치 벡터 P_O - P_T, 상대 속도 벡터 V_O - V_T
+    # Paper Eq. (1), (2)는 geometry.kernels._cpa_tcpa에서 계산
+    dcpa, tcpa = _cpa_tcpa(os_x - ts_x, os_y - ts_y, os_vx - ts_vx, os_vy - ts_vy)
     
-    # 상대 속도 벡터: V_O - V_T
-    dvx = os_vx - ts_vx
-    dvy = os_vy - ts_vy
+    return (dcpa, tcpa)
+
+
+def calculate_cpa_tcpa_batch(
+    os_position: Tuple[float, float],
+    os_velocity: Tuple[float, float],
+    ts_positions: np.ndarray,
+    ts_velocities: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    다수 TS에 대한 CPA와 TCPA 일괄 계산 (calculate_cpa_tcpa의 벡터화 버전)
     
-    # 상대 속도의 크기 제곱: ||V_O - V_T||²
-    rel_speed_sq = dvx**2 + dvy**2
+    Args:
+        os_position: Own Ship 위치 P_O (x, y) in meters
+        os_velocity: Own Ship 속도 벡터 V_O (vx, vy) in m/s
+        ts_positions: Target Ship 위치 배열 (N, 2) in meters
+        ts_velocities: Target Ship 속도 벡터 배열 (N, 2) in m/s
     
-    # Paper Eq. (1): If ||V_O - V_T|| = 0, TCPA = 0
-    if rel_speed_sq < 1e-6:
-        # 상대 속도가 0이면 평행 이동, 현재 거리가 DCPA
-        current_distance = float(np.sqrt(dx**2 + dy**2))
-        return (current_distance, 0.0)  
+    Returns:
+        (dcpa, tcpa) - 길이 N 배열, 의미는 calculate_cpa_tcpa와 동일
+    """
+    dcpa, tcpa, _ = _run_cpa_tcpa_batch(os_position, os_velocity, ts_positions, ts_velocities)
+    return (dcpa, tcpa)
+
+
+def calculate_cpa_tcpa_relative(
+    rel_x: np.ndarray,
+    rel_y: np.ndarray,
+    rel_vx: np.ndarray,
+    rel_vy: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    상대 위치/속도 배열로부터 CPA와 TCPA 계산 (임의 shape, broadcast 지원)
     
-    # Paper Eq. (1): TCPA = -((P_O - P_T) · (V_O - V_T)) / ||V_O - V_T||²
-    # 음수 부호 필수! 내적이 음수면 가까워지는 중 → TCPA > 0
-    tcpa = -(dx * dvx + dy * dvy) / rel_speed_sq
+    OS 하나 기준인 calculate_cpa_tcpa_batch와 달리 (step, TS)처럼
+    OS도 여러 개인 상대 상태를 한 번에 처리한다. 상대 상태의 부호
+    (TS - OS 또는 OS - TS)는 결과에 영향을 주지 않는다.
     
-    # Paper Eq. (2): DCPA = || (P_O + V_O · TCPA) - (P_T + V_T · TCPA) ||
-    cpa_dx = dx + dvx * tcpa
-    cpa_dy = dy + dvy * tcpa
-    dcpa = float(np.sqrt(cpa_dx**2 + cpa_dy**2))
-    tcpa = float(tcpa)
+    Args:
+        rel_x, rel_y: 상대 위치 (meters)
+        rel_vx, rel_vy: 상대 속도 (m/s)
     
+    Returns:
+        (dcpa, tcpa) - broadcast된 shape의 배열, 의미는 calculate_cpa_tcpa와 동일
+    """
+    dcpa, tcpa = _run_cpa_tcpa_relative(rel_x, rel_y, rel_vx, rel_vy)
     return (dcpa, tcpa)
+
@@ -9,16 +9,18 @@ References:
 - Chun et al. (2024). "Method for collision avoidance based on deep reinforcement learning with path-speed control for an autonomous ship."
 - 전도현 (2024). "A Method for Collision Avoidance of a Ship Based on Reinforcement Learning in Complex Maritime Situations(복잡한 해상 상황에서의 강화 학습 기반 선박 충돌 회피 방법)"
 """
+import math
 import numpy as np
 from typing import Tuple, Optional, Dict
 from dataclasses import dataclass
-from .cpa_tcpa import calculate_cpa_tcpa
-from ..geometry import calculate_relative_bearing, velocity_to_heading_speed
-from ..utils import WrapTo360
-from ..encounter.classifier import EncounterClassifier
+from .cpa_tcpa import calculate_cpa_tcpa_batch
+from ..geometry import velocity_to_heading_speed
+from ..geometry.kernels import _full_encounter, _run_full_encounter_batch
+from ..utils import WrapTo360, WrapTo360Array, extract_xy
+from ..encounter.classifier import EncounterClassifier, _ENCOUNTER_VALUES
 
 
-@dataclass
+@dataclass(slots=True)
 class ShipDomainParams:
     """
     Ship Domain 파라미터
@@ -26,6 +28,9 @@ class ShipDomainParams:
     비대칭 타원형 Ship Domain 정의
     COLREGs에 따라 전방 및 우현이 더 긴 형태
     
+    매 CR 계산마다 읽히므로 __slots__ (instance dict 없음)로 정의한다.
+    필드는 기존처럼 생성 후에도 변경할 수 있다.
+    
     Attributes:
         r_bow: 선수(전방) 방향 반경 (meters)
         r_stern: 선미(후방) 방향 반경 (meters)
@@ -68,7 +73,7 @@ def calculate_ship_domain_distance(
     """
     # 방위각을 0-360 범위로 정규화 (중요!)
     bearing = WrapTo360(relative_bearing)
-    bearing_rad = np.radians(bearing)
+    bearing_rad = math.radians(bearing)
     
     # L = shorter length (r_stern = r_port)
     L = min(ship_domain.r_stern, ship_domain.r_port)
@@ -88,9 +93,9 @@ def calculate_ship_domain_distance(
         # (r*sin(θ)/L)² + (r*cos(θ)/r_bow)² = 1
         # r² * [sin²(θ)/L² + cos²(θ)/r_bow²] = 1
         # r = 1 / sqrt(sin²(θ)/L² + cos²(θ)/r_bow²)
-        sin_theta = np.sin(bearing_rad)
-        cos_theta = np.cos(bearing_rad)
-        r = 1.0 / np.sqrt((sin_theta / L)**2 + (cos_theta / r_bow)**2)
+        sin_theta = math.sin(bearing_rad)
+        cos_theta = math.cos(bearing_rad)
+        r = 1.0 / math.hypot(sin_theta / L, cos_theta / r_bow)
         return r
     
     elif 180 <= bearing < 270:
@@ -103,12 +108,165 @@ def calculate_ship_domain_distance(
         # (r*sin(θ)/r_bow)² + (r*cos(θ)/L)² = 1
         # r² * [sin²(θ)/r_bow² + cos²(θ)/L²] = 1
         # r = 1 / sqrt(sin²(θ)/r_bow² + cos²(θ)/L²)
-        sin_theta = np.sin(bearing_rad)
-        cos_theta = np.cos(bearing_rad)
-        r = 1.0 / np.sqrt((sin_theta / r_bow)**2 + (cos_theta / L)**2)
+        sin_theta = math.sin(bearing_rad)
+        cos_theta = math.cos(bearing_rad)
+        r = 1.0 / math.hypot(sin_theta / r_bow, cos_theta / L)
         return r
 
 
+def calculate_ship_domain_distance_batch(
+    relative_bearing: np.ndarray,
+    ship_domain: ShipDomainParams
+) -> np.ndarray:
+    """
+    calculate_ship_domain_distance의 배열 버전
+    
+    Args:
+        relative_bearing: OS 기준 상대 방위각 배열 (N,) degrees
+        ship_domain: Ship Domain 파라미터
+    
+    Returns:
+        각 방위각에서 Ship Domain 경계까지의 거리 배열 (N,) meters
+    """
+    bearing = WrapTo360Array(relative_bearing)
+    bearing_rad = np.radians(bearing)
+    
+    L = min(ship_domain.r_stern, ship_domain.r_port)
+    r_bow = ship_domain.r_bow
+    
+    sin_theta = np.sin(bearing_rad)
+    cos_theta = np.cos(bearing_rad)
+    
+    # 사분면별 경계 방정식 (calculate_ship_domain_distance 참고)
+    return np.select(
+        [bearing < 90, bearing < 180, bearing < 270],
+        [
+            np.full_like(bearing, r_bow),
+            1.0 / np.hypot(sin_theta / L, cos_theta / r_bow),
+            np.full_like(bearing, L),
+        ],
+        default=1.0 / np.hypot(sin_theta / r_bow, cos_theta / L)
+    )
+
+
+def _collision_geometry_batch(
+    encounter_classifier: EncounterClassifier,
+    ship_domain: ShipDomainParams,
+    os_speed: float,
+    os_position: Tuple[float, float],
+    os_velocity: Tuple[float, float],
+    os_heading: float,
+    ts_speeds: np.ndarray,
+    ts_positions: np.ndarray,
+    ts_velocities: np.ndarray,
+    ts_headings: np.ndarray,
+    detail: str = 'full'
+) -> Dict[str, np.ndarray]:
+    """
+    Chun/Jeon CR 계산에 공통으로 쓰이는 값들을 TS 배열에 대해 일괄 계산
+    
+    Args:
+        detail: 'full'이면 모든 값, 'risk_only'면 dcpa, tcpa만 계산
+    
+    Returns:
+        dcpa, tcpa, encounter_type, relative_bearing, ship_domain_radius 배열
+    
+    Raises:
+        ValueError: If detail is not 'full' or 'risk_only'
+    """
+    if detail not in ('full', 'risk_only'):
+        raise ValueError(f"detail must be 'full' or 'risk_only'. Got {detail!r}")
+    
+    if detail == 'risk_only':
+        # CR에는 DCPA, TCPA만 필요하므로 조우 분류/Ship Domain 계산 생략
+        dcpa, tcpa = calculate_cpa_tcpa_batch(
+            os_position, os_velocity,
+            ts_positions, ts_velocities
+        )
+        return {'dcpa': dcpa, 'tcpa': tcpa}
+    
+    # 거리/방위/침로와 DCPA/TCPA를 한 번에 계산 (분류와 CR이 같은 기하량 공유)
+    distance, relative_bearing, relative_course, _, dcpa, tcpa, _ = _run_full_encounter_batch(
+        os_position, os_velocity, os_heading,
+        ts_positions, ts_velocities, ts_headings
+    )
+    domain_radius = calculate_ship_domain_distance_batch(relative_bearing, ship_domain)
+    
+    codes = encounter_classifier.classify_geometry_codes(
+        distance, relative_bearing, relative_course
+    )
+    enc_type = _ENCOUNTER_VALUES[codes]
+    
+    return {
+        'dcpa': dcpa,
+        'tcpa': tcpa,
+        'encounter_type': enc_type,
+        'relative_bearing': relative_bearing,
+        'ship_domain_radius': domain_radius
+    }
+
+
+def select_most_dangerous(cr: np.ndarray, tcpa: np.ndarray,
+                          mask: Optional[np.ndarray] = None) -> Optional[int]:
+    """
+    다수 TS 중 가장 위험한 TS 선택
+    
+    CR이 가장 큰 TS를 선택하고, CR이 같으면 TCPA가 작은 TS를 선택한다.
+    (CR 내림차순, TCPA 오름차순 np.lexsort의 첫 원소)
+    
+    Args:
+        cr: TS별 Collision Risk 배열 (N,)
+        tcpa: TS별 TCPA 배열 (N,) seconds
+        mask: 후보 TS boolean 배열 (N,), 예: 회피 동작이 필요한 TS만 (None이면 전체)
+    
+    Returns:
+        가장 위험한 TS의 index (후보 TS가 없으면 None)
+    """
+    cr = np.asarray(cr, dtype=np.float64).reshape(-1)
+    tcpa = np.asarray(tcpa, dtype=np.float64).reshape(-1)
+    
+    candidates = np.arange(cr.size)
+    if mask is not None:
+        candidates = candidates[np.asarray(mask, dtype=bool).reshape(-1)]
+    if candidates.size == 0:
+        return None
+    
+    # 마지막 key가 1순위; NaN/inf TCPA는 같은 CR 안에서 후순위로 정렬된다
+    order = np.lexsort((tcpa[candidates], -cr[candidates]))
+    return int(candidates[order[0]])
+
+
+def collision_risk_table(result: Dict[str, np.ndarray],
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    calculate_collision_risk_batch 결과를 TS별 record의 structured array로 변환
+    
+    key마다 배열이 따로 있는 dict 대신 TS 하나가 record 하나인 연속 메모리 배열.
+    row['cr']처럼 scalar 결과 dict와 같은 방식으로 접근할 수 있고,
+    table['cr']처럼 열 단위 배열 연산도 그대로 가능하다.
+    
+    Args:
+        result: calculate_collision_risk_batch 반환값 (각 값은 길이 N 배열)
+        out: 재사용할 structured array. dtype이 같고 길이가 N 이상이면
+             새로 할당하지 않고 out[:N]에 덮어쓴다 (매 step 같은 buffer 재사용).
+    
+    Returns:
+        길이 N structured array (field 이름 = result의 key).
+        out을 재사용한 경우 out의 view.
+    """
+    columns = {key: np.asarray(value) for key, value in result.items()}
+    n = len(next(iter(columns.values()))) if columns else 0
+    dtype = np.dtype([(key, column.dtype) for key, column in columns.items()])
+    
+    if out is not None and out.dtype == dtype and out.shape[0] >= n:
+        table = out[:n]
+    else:
+        table = np.empty(n, dtype=dtype)
+    for key, column in columns.items():
+        table[key] = column
+    return table
+
+
 class ChunCollisionRisk:
     """
     Chun et al. 2024 방법론의 Collision Risk Assessment
@@ -228,27 +386,24 @@ class ChunCollisionRisk:
                 - ship_domain_radius: 해당 방위각에서 Ship Domain 반경
                 - f_angle: 각도 보정 계수
         """
-        # DCPA, TCPA 계산
-        dcpa, tcpa = calculate_cpa_tcpa(
-            os_position, os_velocity,
-            ts_position, ts_velocity
+        # 거리, 상대 방위각 (Ship Domain은 OS 중심으로 회전), DCPA, TCPA를 한 번에 계산
+        current_distance, relative_bearing, aspect_angle, dcpa, tcpa, _ = _full_encounter(
+            *extract_xy(os_position), *extract_xy(os_velocity), float(os_heading),
+            *extract_xy(ts_position), *extract_xy(ts_velocity), float(ts_heading)
         )
         
-        # 상대 방위각 (Ship Domain은 OS 중심으로 회전)
-        relative_bearing = calculate_relative_bearing(os_position, os_heading, ts_position)
-        
         # 해당 방위각에서 Ship Domain 반경
         domain_radius = calculate_ship_domain_distance(
-            relative_bearing, 
+            relative_bearing,
             self.ship_domain
-        )    
+        )
 
-        result = self.encounter_classifier.classify(
-            os_position,
-            os_heading,
+        result = self.encounter_classifier.classify_geometry(
+            current_distance,
+            relative_bearing,
+            WrapTo360(ts_heading - os_heading),
+            aspect_angle,
             os_speed,
-            ts_position,
-            ts_heading,
             ts_speed
         )
         enc_type = result.encounter_type.value
@@ -262,8 +417,8 @@ class ChunCollisionRisk:
         
         # Paper Eq. (6): CR = f_angle · exp(-DCPA/a) · exp(-TCPA/b)
         # Note: Use abs(tcpa) for TCPA term since when TCPA < 0, risk should decrease as time passes
-        cr_dcpa = np.exp(-dcpa / self.a_coeff)
-        cr_tcpa = np.exp(-abs(tcpa) / self.b_coeff)
+        cr_dcpa = math.exp(-dcpa / self.a_coeff)
+        cr_tcpa = math.exp(-abs(tcpa) / self.b_coeff)
         cr = f_angle * cr_dcpa * cr_tcpa
         
         return {
@@ -279,6 +434,63 @@ class ChunCollisionRisk:
         }
 
 
+    def calculate_collision_risk_batch(
+        self,
+        os_speed: float,
+        os_position: Tuple[float, float],
+        os_velocity: Tuple[float, float],
+        os_heading: float,
+        ts_speeds: np.ndarray,
+        ts_positions: np.ndarray,
+        ts_velocities: np.ndarray,
+        ts_headings: np.ndarray,
+        *,
+        detail: str = 'full'
+    ) -> Dict[str, np.ndarray]:
+        """
+        다수 TS에 대한 Collision Risk 일괄 계산 (calculate_collision_risk의 벡터화 버전)
+        
+        Args:
+            os_*: Own Ship 정보 (calculate_collision_risk와 동일)
+            ts_speeds: Target Ship 속도 배열 (N,) m/s
+            ts_positions: Target Ship 위치 배열 (N, 2) meters
+            ts_velocities: Target Ship 속도 벡터 배열 (N, 2) m/s
+            ts_headings: Target Ship 선수방위 배열 (N,) degrees
+            detail: 'full' (기본값) 또는 'risk_only'.
+                'risk_only'면 조우 분류와 Ship Domain 계산을 생략하고
+                cr, dcpa, tcpa만 반환 (매 step CR만 필요한 planner 루프용)
+        
+        Returns:
+            calculate_collision_risk와 같은 key를 가지며 각 값이 길이 N 배열인 dict
+        
+        Raises:
+            ValueError: If detail is not 'full' or 'risk_only'
+        """
+        result = _collision_geometry_batch(
+            self.encounter_classifier, self.ship_domain,
+            os_speed, os_position, os_velocity, os_heading,
+            ts_speeds, ts_positions, ts_velocities, ts_headings,
+            detail
+        )
+        dcpa = result['dcpa']
+        tcpa = result['tcpa']
+        
+        # f_angle: TCPA < 0 (이미 CPA 통과)이면 0.25
+        f_angle = np.where(tcpa < 0, 0.25, 1.0)
+        
+        # Paper Eq. (6): CR = f_angle · exp(-DCPA/a) · exp(-TCPA/b)
+        cr_dcpa = np.exp(-dcpa / self.a_coeff)
+        cr_tcpa = np.exp(-np.abs(tcpa) / self.b_coeff)
+        
+        result['cr'] = f_angle * cr_dcpa * cr_tcpa
+        if detail == 'risk_only':
+            return result
+        result['f_angle'] = f_angle
+        result['cr_dcpa_component'] = cr_dcpa
+        result['cr_tcpa_component'] = cr_tcpa
+        return result
+
+
 class JeonCollisionRisk:
     """
     전도현 논문 (2024) 방법론의 Collision Risk Assessment
@@ -373,27 +585,24 @@ class JeonCollisionRisk:
         Returns:
             Dictionary containing collision risk metrics
         """
-        # DCPA, TCPA 계산
-        dcpa, tcpa = calculate_cpa_tcpa(
-            os_position, os_velocity,
-            ts_position, ts_velocity
+        # 거리, 상대 방위각, DCPA, TCPA를 한 번에 계산
+        current_distance, relative_bearing, aspect_angle, dcpa, tcpa, _ = _full_encounter(
+            *extract_xy(os_position), *extract_xy(os_velocity), float(os_heading),
+            *extract_xy(ts_position), *extract_xy(ts_velocity), float(ts_heading)
         )
         
-        # 상대 방위각
-        relative_bearing = calculate_relative_bearing(os_position, os_heading, ts_position)
-        
         # 해당 방위각에서 Ship Domain 반경
         domain_radius = calculate_ship_domain_distance(
             relative_bearing,
             self.ship_domain
-        )     
+        )
 
-        result = self.encounter_classifier.classify(
-            os_position,
-            os_heading,
+        result = self.encounter_classifier.classify_geometry(
+            current_distance,
+            relative_bearing,
+            WrapTo360(ts_heading - os_heading),
+            aspect_angle,
             os_speed,
-            ts_position,
-            ts_heading,
             ts_speed
         )
         enc_type = result.encounter_type.value
@@ -404,10 +613,10 @@ class JeonCollisionRisk:
         dcpa_norm = dcpa / self.c_dcpa if self.c_dcpa > 0 else 0.0
         
         # Inner exponential: exp(-(TCPA/c_TCPA + DCPA/c_DCPA))
-        inner_exp = np.exp(-(tcpa_norm + dcpa_norm))
+        inner_exp = math.exp(-(tcpa_norm + dcpa_norm))
         
         # CR = cos((π/2) * (1 - inner_exp))
-        cr = np.cos((np.pi / 2.0) * (1.0 - inner_exp))
+        cr = math.cos((math.pi / 2.0) * (1.0 - inner_exp))
         
         return {
             'cr': cr,
@@ -420,3 +629,57 @@ class JeonCollisionRisk:
             'dcpa_norm': dcpa_norm,
             'inner_exp': inner_exp
         }
+
+    def calculate_collision_risk_batch(
+        self,
+        os_speed: float,
+        os_position: Tuple[float, float],
+        os_velocity: Tuple[float, float],
+        os_heading: float,
+        ts_speeds: np.ndarray,
+        ts_positions: np.ndarray,
+        ts_velocities: np.ndarray,
+        ts_headings: np.ndarray,
+        *,
+        detail: str = 'full'
+    ) -> Dict[str, np.ndarray]:
+        """
+        다수 TS에 대한 Collision Risk 일괄 계산 (calculate_collision_risk의 벡터화 버전)
+        
+        Args:
+            os_*: Own Ship 정보 (calculate_collision_risk와 동일)
+            ts_speeds: Target Ship 속도 배열 (N,) m/s
+            ts_positions: Target Ship 위치 배열 (N, 2) meters
+            ts_velocities: Target Ship 속도 벡터 배열 (N, 2) m/s
+            ts_headings: Target Ship 선수방위 배열 (N,) degrees
+            detail: 'full' (기본값) 또는 'risk_only'.
+                'risk_only'면 조우 분류와 Ship Domain 계산을 생략하고
+                cr, dcpa, tcpa만 반환 (매 step CR만 필요한 planner 루프용)
+        
+        Returns:
+            calculate_collision_risk와 같은 key를 가지며 각 값이 길이 N 배열인 dict
+        
+        Raises:
+            ValueError: If detail is not 'full' or 'risk_only'
+        """
+        result = _collision_geometry_batch(
+            self.encounter_classifier, self.ship_domain,
+            os_speed, os_position, os_velocity, os_heading,
+            ts_speeds, ts_positions, ts_velocities, ts_headings,
+            detail
+        )
+        
+        # Paper Eq. (3)
+        tcpa = np.abs(result['tcpa'])
+        dcpa = result['dcpa']
+        tcpa_norm = tcpa / self.c_tcpa if self.c_tcpa > 0 else np.zeros_like(tcpa)
+        dcpa_norm = dcpa / self.c_dcpa if self.c_dcpa > 0 else np.zeros_like(dcpa)
+        inner_exp = np.exp(-(tcpa_norm + dcpa_norm))
+        
+        result['cr'] = np.cos((np.pi / 2.0) * (1.0 - inner_exp))
+        if detail == 'risk_only':
+            return result
+        result['tcpa_norm'] = tcpa_norm
+        result['dcpa_norm'] = dcpa_norm
+        result['inner_exp'] = inner_exp
+        return result
@@ -1,8 +1,11 @@
-from .utils import WrapTo180, WrapTo360, distance, cross_track_error, ref_course_angle
+from .utils import WrapTo180, WrapTo360, WrapTo180Array, WrapTo360Array, extract_xy, distance, cross_track_error, ref_course_angle
 
 __all__ = [
     'WrapTo180',
     'WrapTo360',
+    'WrapTo180Array',
+    'WrapTo360Array',
+    'extract_xy',
     'distance',
     'cross_track_error',
     'ref_course_angle',
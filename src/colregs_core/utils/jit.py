@@ -0,0 +1,26 @@
+"""
+Numba JIT 호환 레이어
+
+numba가 설치되어 있으면 njit/prange를 그대로 사용하고,
+없으면 같은 코드가 순수 Python으로 동작하도록 대체 decorator를 제공한다.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba 미설치: 순수 Python fallback
+    NUMBA_AVAILABLE = False
+    prange = range  # type: ignore[misc]
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """numba.njit 대체 (함수를 그대로 반환)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
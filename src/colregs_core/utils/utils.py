@@ -3,7 +3,7 @@ import sys
 from math import pi, atan2, sin, cos, sqrt
 import numpy as np
 import time
-from typing import Any
+from typing import Any, Tuple
 import math
 
 
@@ -23,10 +23,11 @@ def WrapToPi(rad, positive=False):
         The function `WrapToPi(rad)` returns the angle `rad` wrapped to the range [-pi, pi].
 
     """
-    while rad > pi:
-        rad = rad - 2 * pi
-    while rad < -pi:
-        rad = rad + 2 * pi
+    rad = math.fmod(rad, 2 * pi)
+    if rad > pi:
+        rad -= 2 * pi
+    elif rad < -pi:
+        rad += 2 * pi
 
     return rad if not positive else abs(rad)
 
@@ -53,10 +54,11 @@ def WrapTo180(deg, positive=False):
     """
     Transform an angle to the range (-180, 180].
     """
-    while deg > 180:
-        deg = deg - 360
-    while deg < -180:
-        deg = deg + 360
+    deg = math.fmod(deg, 360.0)
+    if deg > 180.0:
+        deg -= 360.0
+    elif deg < -180.0:
+        deg += 360.0
 
     return deg if not positive else abs(deg)
 
@@ -96,6 +98,50 @@ def WrapTo360(deg):
     
     return deg
 
+def WrapTo180Array(deg, out=None):
+    """
+    Array version of `WrapTo180`: transform angles to the range (-180, 180].
+    
+    If `out` is given, the result is written into it (it may be `deg` itself),
+    so no intermediate arrays are allocated.
+    """
+    deg = np.asarray(deg, dtype=float)
+    if out is None:
+        out = np.empty_like(deg)
+    np.fmod(deg, 360.0, out=out)
+    np.subtract(out, 360.0, out=out, where=out > 180.0)
+    np.add(out, 360.0, out=out, where=out < -180.0)
+    return out
+
+
+def WrapTo360Array(deg, out=None):
+    """
+    Array version of `WrapTo360`: transform angles to the range [0, 360).
+    
+    Values within 1e-6 of 0° or 360° are snapped to 0° as in `WrapTo360`.
+    If `out` is given, the result is written into it (it may be `deg` itself),
+    so no intermediate arrays are allocated.
+    """
+    deg = np.asarray(deg, dtype=float)
+    if out is None:
+        out = np.empty_like(deg)
+    np.mod(deg, 360.0, out=out)
+    np.copyto(out, 0.0, where=(out < 1e-6) | (360.0 - out < 1e-6))
+    return out
+
+def extract_xy(vec) -> Tuple[float, float]:
+    """
+    Extract (x, y) as two Python floats from a single 2D point or vector.
+    
+    Accepts a tuple/list of length 2 or a numpy array of shape (2,), (2, 1) or (1, 2).
+    """
+    if isinstance(vec, (tuple, list)):
+        return float(vec[0]), float(vec[1])
+    flat = np.ravel(vec)
+    if flat.size != 2:
+        raise ValueError(f"Expected a single (x, y) point. Got shape {np.shape(vec)}")
+    return float(flat[0]), float(flat[1])
+
 def distance(point1, point2):
     """
     Compute the distance between two points.
@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""
+Batch API 검증 테스트
+
+classify_batch / calculate_cpa_tcpa_batch 결과가 TS별 scalar 호출 결과와
+동일한지 확인합니다.
+"""
+import itertools
+
+import numpy as np
+import pytest
+
+from colregs_core import EncounterClassifier, EncounterSituation, EncounterType
+from colregs_core.geometry import (
+    warmup_kernels,
+    heading_speed_to_velocity,
+    calculate_bearing_rate,
+    calculate_bearing_rate_batch,
+    calculate_relative_bearing,
+    calculate_relative_bearing_batch,
+)
+from colregs_core.risk import (
+    ShipDomainParams,
+    JeonCollisionRisk,
+    ChunCollisionRisk,
+    calculate_cpa_tcpa,
+    calculate_cpa_tcpa_batch,
+    calculate_cpa_tcpa_relative,
+    select_most_dangerous,
+    collision_risk_table,
+)
+
+
+# classify_batch_codes의 code -> EncounterType
+_CODE_TYPES = [
+    EncounterType.SAFE, EncounterType.OVERTAKING, EncounterType.HEAD_ON,
+    EncounterType.CROSSING_GIVE_WAY, EncounterType.CROSSING_STAND_ON,
+]
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    """모듈 전체에서 공유하는 classifier (numba 커널은 여기서 한 번만 컴파일)"""
+    warmup_kernels()
+    return EncounterClassifier()
+
+
+@pytest.fixture(scope="module")
+def ship_domain():
+    return ShipDomainParams(r_bow=6.0, r_stern=2.0, r_starboard=6.0, r_port=2.0)
+
+
+@pytest.fixture(scope="module")
+def cr_models(classifier, ship_domain):
+    return (
+        JeonCollisionRisk(ship_domain, os_speed=2.0, ts_speed=2.0),
+        ChunCollisionRisk(ship_domain),
+    )
+
+
+def _make_targets():
+    """OS 주변 다양한 방위/침로의 TS 목록 (경계각 포함)"""
+    bearings = np.arange(0.0, 360.0, 22.5)
+    headings = np.arange(0.0, 360.0, 22.5) + 5.0
+    targets = []
+    for b, h in itertools.product(bearings, headings):
+        rng = 500.0
+        pos = (rng * np.cos(np.radians(b)), rng * np.sin(np.radians(b)))
+        targets.append((pos, h, 3.0))
+    # 안전 거리 밖 TS
+    targets.append(((5000.0, 0.0), 180.0, 3.0))
+    return targets
+
+
+@pytest.fixture(scope="module")
+def target_arrays():
+    """_make_targets()를 batch API 입력 배열 (positions, headings, speeds, velocities)로 쌓은 것"""
+    targets = _make_targets()
+    positions = np.array([t[0] for t in targets])
+    headings = np.array([t[1] for t in targets])
+    speeds = np.array([t[2] for t in targets])
+    velocities = np.array([heading_speed_to_velocity(h, v) for h, v in zip(headings, speeds)])
+    return positions, headings, speeds, velocities
+
+
+def test_classify_batch_matches_scalar(classifier, target_arrays):
+    os_position, os_heading, os_speed = (10.0, -20.0), 30.0, 4.0
+    positions, headings, speeds, _ = target_arrays
+
+    batch = classifier.classify_batch(os_position, os_heading, os_speed, positions, headings, speeds)
+
+    for i, (pos, hdg, spd) in enumerate(zip(positions, headings, speeds)):
+        situation = classifier.classify(os_position, os_heading, os_speed, pos, hdg, spd)
+        assert batch.encounter_type[i] == situation.encounter_type
+        assert np.isclose(batch.relative_bearing[i], situation.relative_bearing)
+        assert np.isclose(batch.relative_course[i], situation.relative_course)
+        assert np.isclose(batch.distance[i], situation.distance)
+        assert np.isclose(batch.aspect_angle[i], situation.aspect_angle)
+
+    assert batch.encounter_type[-1] == EncounterType.SAFE
+
+
+def test_classify_dispatches_arrays(classifier, target_arrays):
+    ts_positions, ts_headings, ts_speeds, _ = (a[::11] for a in target_arrays)
+
+    batch = classifier.classify(np.array([0.0, 0.0]), 15.0, 4.0, ts_positions, ts_headings, ts_speeds)
+    expected = classifier.classify_batch((0.0, 0.0), 15.0, 4.0, ts_positions, ts_headings, ts_speeds)
+    assert np.array_equal(batch.encounter_type, expected.encounter_type)
+
+    # 길이 2 배열은 scalar 입력으로 처리
+    situation = classifier.classify(np.array([0.0, 0.0]), 15.0, 4.0, ts_positions[0], ts_headings[0], 3.0)
+    assert situation.encounter_type == expected.encounter_type[0]
+    assert isinstance(situation.distance, float)
+
+    # column vector (2, 1) 입력은 두 인자 모두 단일 위치
+    column = classifier.classify(
+        np.array([[0.0], [0.0]]), 15.0, 4.0, ts_positions[0].reshape(2, 1), ts_headings[0], 3.0
+    )
+    assert isinstance(column, EncounterSituation)
+    assert column == situation
+
+    # heading 배열로 위임 여부를 정하므로 (2, 2)는 TS 2척, (1, 2) + scalar heading은 단일 위치
+    pair = classifier.classify((0.0, 0.0), 15.0, 4.0, ts_positions[:2], ts_headings[:2], ts_speeds[:2])
+    assert np.array_equal(pair.encounter_type, expected.encounter_type[:2])
+    row = classifier.classify((0.0, 0.0), 15.0, 4.0, ts_positions[:1], ts_headings[0], 3.0)
+    assert row == situation
+    single = classifier.classify((0.0, 0.0), 15.0, 4.0, ts_positions[:1], ts_headings[:1], ts_speeds[:1])
+    assert np.array_equal(single.encounter_type, expected.encounter_type[:1])
+
+
+def test_scalar_and_batch_rules_agree_on_sector_boundaries(classifier):
+    angles = np.arange(0.0, 360.0, 22.5)
+    rb, rc = (a.ravel() for a in np.meshgrid(angles, angles))
+
+    codes = classifier._classify_encounter_codes(rb, rc)
+
+    for b, c, code in zip(rb, rc, codes):
+        situation = classifier.classify_geometry(100.0, b, c, 0.0, 3.0, 3.0)
+        assert situation.encounter_type == _CODE_TYPES[code], (b, c)
+
+
+def test_encounter_lut_matches_rule_masks(classifier):
+    boundaries = np.arange(16) * 22.5
+    angles = np.concatenate([
+        boundaries,
+        np.nextafter(boundaries[1:], -np.inf),
+        np.nextafter(boundaries, np.inf),
+        np.random.default_rng(0).uniform(0.0, 360.0, 200),
+    ])
+    rb, rc = (a.ravel() for a in np.meshgrid(angles, angles))
+
+    expected = np.select(list(classifier._rule_masks(rb, rc)), [1, 2, 3, 4], default=0)
+    assert np.array_equal(classifier._classify_encounter_codes(rb, rc), expected)
+
+
+def test_classify_geometry_wraps_angles(classifier):
+    """[0, 360) 밖의 각도는 wrap된 각도와 같은 결과 (lookup table 범위 밖 접근 없음)"""
+    cases = [(360.0, 0.0), (-30.0, 330.0), (720.0, 0.0), (400.0, 40.0)]
+    courses = [180.0, 540.0, -180.0, 250.0, -110.0]
+    for rb, wrapped_rb in cases:
+        for rc in courses:
+            expected = classifier.classify_geometry(100.0, wrapped_rb, rc % 360.0, 0.0, 3.0, 3.0)
+            result = classifier.classify_geometry(100.0, rb, rc, 0.0, 3.0, 3.0)
+            assert result.encounter_type == expected.encounter_type, (rb, rc)
+
+    rb = np.array([c[0] for c in cases] * len(courses))
+    rc = np.repeat(courses, len(cases))
+    codes = classifier.classify_geometry_codes(np.full(rb.shape, 100.0), rb, rc)
+    expected = classifier.classify_geometry_codes(
+        np.full(rb.shape, 100.0), np.array([c[1] for c in cases] * len(courses)), rc % 360.0
+    )
+    assert np.array_equal(codes, expected)
+
+    # NaN 각도는 SAFE
+    assert classifier.classify_geometry(100.0, np.nan, 180.0, 0.0, 3.0, 3.0).encounter_type == EncounterType.SAFE
+    assert classifier.classify_geometry_codes(
+        np.array([100.0, 100.0]), np.array([np.nan, 0.0]), np.array([180.0, 180.0])
+    ).tolist() == [0, 2]
+
+
+def test_classify_batch_all_far():
+    classifier = EncounterClassifier(safe_distance=100.0)
+    batch = classifier.classify_batch(
+        (0.0, 0.0), 0.0, 3.0,
+        np.array([[500.0, 0.0], [0.0, -800.0]]),
+        np.array([180.0, 90.0]),
+        np.array([3.0, 3.0])
+    )
+
+    assert all(t == EncounterType.SAFE for t in batch.encounter_type)
+    assert np.all(batch.relative_bearing == 0.0)
+    assert np.allclose(batch.distance, [500.0, 800.0])
+
+    # parallel 커널 경로 (TS 9척 이상)에서도 먼 TS는 각도 0
+    angles = np.radians(np.arange(12) * 30.0)
+    positions = np.stack([np.cos(angles), np.sin(angles)], axis=1) * np.linspace(50.0, 600.0, 12)[:, None]
+    batch = classifier.classify_batch((0.0, 0.0), 0.0, 3.0, positions, np.full(12, 180.0), np.full(12, 3.0))
+    far = batch.distance > 100.0
+    assert far.any() and not far.all()
+    assert np.all(batch.relative_bearing[far] == 0.0) and np.all(batch.aspect_angle[far] == 0.0)
+    assert np.all(batch.relative_course[~far] == 180.0)
+
+
+def test_numpy_encounter_geometry_batch_matches_kernel(target_arrays):
+    """numba가 없을 때 쓰는 NumPy batch 커널이 njit 커널과 같은 결과인지 확인"""
+    from colregs_core.geometry.kernels import (
+        _encounter_geometry_batch, _encounter_geometry_batch_numpy
+    )
+
+    positions, headings, _, _ = target_arrays
+    # 마지막 1개: OS와 같은 위치의 TS
+    ts = np.concatenate([np.column_stack([positions, headings]), [[10.0, -20.0, 200.0]]])
+    for safe_distance in (2000.0, 400.0):
+        args = (10.0, -20.0, 30.0, *(np.ascontiguousarray(c) for c in ts.T), safe_distance)
+        expected = tuple(np.empty(len(ts)) for _ in range(4))
+        result = tuple(np.empty(len(ts)) for _ in range(4))
+        _encounter_geometry_batch(*args, *expected)
+        _encounter_geometry_batch_numpy(*args, *result)
+        for e, r in zip(expected, result):
+            assert np.allclose(r, e)
+
+
+def test_classify_batch_codes(classifier, target_arrays):
+    args = ((0.0, 0.0), 45.0, 3.0, *target_arrays[:3])
+
+    codes = classifier.classify_batch_codes(*args)[0]
+    batch = classifier.classify_batch(*args)
+
+    assert codes.dtype == np.int8
+    assert [_CODE_TYPES[c] for c in codes] == list(batch.encounter_type)
+
+
+def test_relative_bearing_batch_matches_scalar(target_arrays):
+    os_position, os_heading = (10.0, -20.0), 30.0
+    positions = target_arrays[0]
+
+    bearings = calculate_relative_bearing_batch(os_position, os_heading, positions)
+
+    assert bearings.shape == (len(positions),)
+    assert np.all((bearings >= 0.0) & (bearings < 360.0))
+    for bearing, pos in zip(bearings, positions):
+        expected = calculate_relative_bearing(os_position, os_heading, pos)
+        # 0/360 경계에서 wrap 방향이 달라도 같은 방위
+        assert np.isclose((bearing - expected + 180.0) % 360.0, 180.0)
+
+
+def test_cpa_tcpa_batch_matches_scalar():
+    os_position = (0.0, 0.0)
+    os_velocity = (5.0, 0.0)
+    targets = [
+        ((1000.0, 0.0), (-5.0, 0.0)),     # head-on
+        ((0.0, 500.0), (0.0, -5.0)),      # crossing
+        ((-300.0, 0.0), (5.0, 0.0)),      # 평행 (상대속도 0)
+        ((-300.0, 100.0), (-3.0, 0.0)),   # 멀어지는 중
+        ((200.0, -200.0), heading_speed_to_velocity(45.0, 4.0)),  # 좌현 전방에서 접근
+    ]
+
+    ts_positions = np.array([t[0] for t in targets])
+    ts_velocities = np.array([t[1] for t in targets])
+    dcpa, tcpa = calculate_cpa_tcpa_batch(os_position, os_velocity, ts_positions, ts_velocities)
+    bearing_rate = calculate_bearing_rate_batch(
+        os_position, os_velocity, ts_positions, ts_velocities
+    )
+
+    for i, (ts_position, ts_velocity) in enumerate(targets):
+        expected_dcpa, expected_tcpa = calculate_cpa_tcpa(
+            os_position, os_velocity, ts_position, ts_velocity
+        )
+        assert np.isclose(dcpa[i], expected_dcpa)
+        assert np.isclose(tcpa[i], expected_tcpa)
+        assert np.isclose(
+            bearing_rate[i],
+            calculate_bearing_rate(os_position, os_velocity, ts_position, ts_velocity)
+        )
+
+    assert tcpa[2] == 0.0
+    assert tcpa[3] < 0.0
+
+
+def test_numpy_cpa_tcpa_batch_matches_kernel(target_arrays):
+    """numba가 없을 때 쓰는 NumPy batch 커널이 njit 커널과 같은 결과인지 확인"""
+    from colregs_core.geometry.kernels import _cpa_tcpa_batch, _cpa_tcpa_batch_numpy
+
+    positions, _, _, velocities = target_arrays
+    # 마지막 2개: OS와 같은 위치 / OS와 같은 속도의 TS
+    ts = np.concatenate([
+        np.hstack([positions, velocities]),
+        [[10.0, -20.0, 0.0, 3.0], [100.0, 50.0, 2.0, 1.0]],
+    ])
+    args = (10.0, -20.0, 2.0, 1.0, *(np.ascontiguousarray(c) for c in ts.T))
+
+    expected = tuple(np.empty(len(ts)) for _ in range(3))
+    result = tuple(np.empty(len(ts)) for _ in range(3))
+    _cpa_tcpa_batch(*args, *expected)
+    _cpa_tcpa_batch_numpy(*args, *result)
+    for e, r in zip(expected, result):
+        assert np.allclose(r, e)
+    assert result[2][-2] == 0.0 and result[1][-1] == 0.0
+
+
+def test_cpa_tcpa_relative_broadcasts():
+    rng = np.random.default_rng(3)
+    ts_positions = rng.uniform(-800.0, 800.0, size=(6, 2))
+    ts_velocities = rng.uniform(-4.0, 4.0, size=(6, 2))
+    ts_velocities[0] = (2.0, 1.0)  # OS와 같은 속도 (상대 속도 0)
+    os_positions = np.array([[0.0, 0.0], [50.0, -20.0], [100.0, -40.0]])
+    os_velocity = np.array([2.0, 1.0])
+
+    rel = ts_positions[None, :, :] - os_positions[:, None, :]  # (step, TS, 2)
+    rel_v = ts_velocities - os_velocity                          # (TS, 2)
+    dcpa, tcpa = calculate_cpa_tcpa_relative(rel[..., 0], rel[..., 1], rel_v[:, 0], rel_v[:, 1])
+
+    assert dcpa.shape == tcpa.shape == (3, 6)
+    for step, os_position in enumerate(os_positions):
+        expected_dcpa, expected_tcpa = calculate_cpa_tcpa_batch(
+            os_position, os_velocity, ts_positions, ts_velocities
+        )
+        assert np.allclose(dcpa[step], expected_dcpa)
+        assert np.allclose(tcpa[step], expected_tcpa)
+    assert np.all(tcpa[:, 0] == 0.0)
+
+
+def test_select_most_dangerous():
+    cr = np.array([0.2, 0.8, 0.8, 0.1])
+    tcpa = np.array([10.0, 40.0, 25.0, 5.0])
+
+    assert select_most_dangerous(cr, tcpa) == 2
+    assert select_most_dangerous([0.1, 0.5, 0.5], [1.0, np.nan, 30.0]) == 2
+    assert select_most_dangerous([0.1, 0.5], [1.0, np.inf]) == 1
+    assert select_most_dangerous([], []) is None
+
+    action = np.array([True, False, False, True])
+    assert select_most_dangerous(cr, tcpa, mask=action) == 0
+    assert select_most_dangerous(cr, tcpa, mask=np.zeros(4, dtype=bool)) is None
+
+
+def test_collision_risk_batch_matches_scalar(cr_models, target_arrays):
+    os_speed, os_position, os_heading = 2.0, (0.0, 0.0), 10.0
+    os_velocity = heading_speed_to_velocity(os_heading, os_speed)
+    positions, headings, speeds, velocities = (a[::7] for a in target_arrays)
+
+    for cr_model in cr_models:
+        batch = cr_model.calculate_collision_risk_batch(
+            os_speed, os_position, os_velocity, os_heading,
+            speeds, positions, velocities, headings
+        )
+        for i, (pos, hdg, spd, vel) in enumerate(zip(positions, headings, speeds, velocities)):
+            expected = cr_model.calculate_collision_risk(
+                os_speed, os_position, os_velocity, os_heading, spd, pos, vel, hdg
+            )
+            for key, value in expected.items():
+                if isinstance(value, str):
+                    assert batch[key][i] == value
+                else:
+                    assert np.isclose(batch[key][i], value), key
+
+
+def test_full_encounter_matches_geometry_functions():
+    from colregs_core.geometry import calculate_relative_bearing, calculate_aspect_angle
+    from colregs_core.geometry.kernels import _full_encounter
+
+    os_position, os_heading = (10.0, -20.0), 30.0
+    os_velocity = heading_speed_to_velocity(os_heading, 4.0)
+    # 마지막 3개: OS와 같은 위치의 TS (aspect는 atan2(0, 0) = 0 기준)
+    coincident = [(os_position, hdg, 3.0) for hdg in (0.0, 90.0, 200.0)]
+    for pos, hdg, spd in _make_targets() + coincident:
+        ts_velocity = heading_speed_to_velocity(hdg, spd)
+        dist, rb, aspect, dcpa, tcpa, br = _full_encounter(
+            *os_position, *os_velocity, os_heading, *pos, *ts_velocity, hdg
+        )
+        expected_dcpa, expected_tcpa = calculate_cpa_tcpa(
+            os_position, os_velocity, pos, ts_velocity
+        )
+        assert np.isclose(dist, np.hypot(pos[0] - os_position[0], pos[1] - os_position[1]))
+        assert np.isclose(rb, calculate_relative_bearing(os_position, os_heading, pos))
+        assert np.isclose(aspect, calculate_aspect_angle(hdg, os_position, pos))
+        assert np.isclose(dcpa, expected_dcpa)
+        assert np.isclose(tcpa, expected_tcpa)
+        assert np.isclose(
+            br, calculate_bearing_rate(os_position, os_velocity, pos, ts_velocity)
+        )
+
+
+def test_numpy_full_encounter_batch_matches_kernel(target_arrays):
+    """numba가 없을 때 쓰는 NumPy batch 커널이 njit 커널과 같은 결과인지 확인"""
+    from colregs_core.geometry.kernels import _full_encounter_batch, _full_encounter_batch_numpy
+
+    positions, headings, _, velocities = target_arrays
+    # 마지막 2개: OS와 같은 위치의 TS (aspect는 atan2(0, 0) = 0 기준)
+    ts = np.concatenate([
+        np.column_stack([positions, velocities, headings]),
+        [[10.0, -20.0, 0.0, 3.0, 90.0], [10.0, -20.0, -1.0, 0.0, 200.0]],
+    ])
+    args = (10.0, -20.0, 2.0, 1.0, 30.0, *(np.ascontiguousarray(c) for c in ts.T))
+
+    expected = tuple(np.empty(len(ts)) for _ in range(7))
+    result = tuple(np.empty(len(ts)) for _ in range(7))
+    _full_encounter_batch(*args, *expected)
+    _full_encounter_batch_numpy(*args, *result)
+    for e, r in zip(expected, result):
+        assert np.allclose(r, e)
+
+
+def test_collision_risk_batch_risk_only(cr_models, target_arrays):
+    os_speed, os_position, os_heading = 2.0, (0.0, 0.0), 10.0
+    os_velocity = heading_speed_to_velocity(os_heading, os_speed)
+    positions, headings, speeds, velocities = (a[::11] for a in target_arrays)
+    args = (os_speed, os_position, os_velocity, os_heading, speeds, positions, velocities, headings)
+
+    for cr_model in cr_models:
+        full = cr_model.calculate_collision_risk_batch(*args)
+        risk_only = cr_model.calculate_collision_risk_batch(*args, detail='risk_only')
+        assert set(risk_only) == {'cr', 'dcpa', 'tcpa'}
+        for key, value in risk_only.items():
+            assert np.allclose(value, full[key])
+
+        with pytest.raises(ValueError):
+            cr_model.calculate_collision_risk_batch(*args, detail='verbose')
+
+
+def test_small_batches_match_large_batches(cr_models, target_arrays):
+    """TS 수가 적을 때의 단일 스레드 커널과 parallel 커널 결과가 같은지 확인"""
+    os_velocity = heading_speed_to_velocity(10.0, 2.0)
+    positions, headings, speeds, velocities = (a[::9] for a in target_arrays)
+    args = (speeds, positions, velocities, headings)
+    assert len(positions) > 8
+
+    for cr_model in cr_models:
+        large = cr_model.calculate_collision_risk_batch(2.0, (0.0, 0.0), os_velocity, 10.0, *args)
+        for start in range(0, len(positions), 4):
+            small = cr_model.calculate_collision_risk_batch(
+                2.0, (0.0, 0.0), os_velocity, 10.0, *(a[start:start + 4] for a in args)
+            )
+            for key, values in small.items():
+                assert np.array_equal(values, large[key][start:start + 4]), key
+
+
+def test_collision_risk_batch_length_mismatch(cr_models):
+    with pytest.raises(ValueError):
+        cr_models[0].calculate_collision_risk_batch(
+            2.0, (0.0, 0.0), (2.0, 0.0), 0.0,
+            np.array([3.0, 3.0]),
+            np.array([[100.0, 0.0], [0.0, 100.0]]),
+            np.array([[-3.0, 0.0]]),
+            np.array([180.0, 270.0])
+        )
+
+
+def test_collision_risk_table(cr_models, target_arrays):
+    os_velocity = heading_speed_to_velocity(10.0, 2.0)
+    positions, headings, speeds, velocities = (a[::13] for a in target_arrays)
+    result = cr_models[0].calculate_collision_risk_batch(
+        2.0, (0.0, 0.0), os_velocity, 10.0, speeds, positions, velocities, headings
+    )
+
+    table = collision_risk_table(result)
+
+    assert table.shape == (len(positions),)
+    assert set(table.dtype.names) == set(result)
+    for key, values in result.items():
+        assert np.array_equal(table[key], values)
+    assert table[0]['encounter_type'] == result['encounter_type'][0]
+
+    pool = np.zeros(len(positions) + 3, dtype=table.dtype)
+    reused = collision_risk_table(result, out=pool)
+    assert reused.base is pool
+    assert np.array_equal(reused, table)
+    assert collision_risk_table(result, out=pool[:2]).base is None
+
+
+def test_dynamic_scenario_single_batch(classifier):
+    """
+    30 step 동적 시나리오를 classify_batch 한 번으로 분류
+
+    OS 침로/속력이 일정하면 step마다의 OS 기준 상대 위치만으로 조우 상황이
+    결정되므로, 모든 (step, TS) 쌍을 OS 원점 기준 배열로 쌓아 한 번에 분류한다.
+    """
+    dt, n_steps = 10.0, 30
+    os_heading, os_speed = 0.0, 5.0
+    os_velocity = np.array(heading_speed_to_velocity(os_heading, os_speed))
+    # (초기 위치, heading, speed)
+    scenarios = {
+        'head_on': ((1500.0, 10.0), 180.0, 5.0),
+        'crossing': ((1000.0, 1000.0), 250.0, 5.0),
+        'overtaking': ((300.0, 5.0), 0.0, 2.0),
+    }
+
+    t = np.arange(n_steps)[:, None] * dt
+    rel_positions, ts_headings, ts_speeds = [], [], []
+    for position, heading, speed in scenarios.values():
+        rel_velocity = np.array(heading_speed_to_velocity(heading, speed)) - os_velocity
+        rel_positions.append(np.asarray(position) + t * rel_velocity)
+        ts_headings.append(np.full(n_steps, heading))
+        ts_speeds.append(np.full(n_steps, speed))
+
+    codes, *_ = classifier.classify_batch_codes(
+        (0.0, 0.0), os_heading, os_speed,
+        np.concatenate(rel_positions),
+        np.concatenate(ts_headings),
+        np.concatenate(ts_speeds)
+    )
+    codes = codes.reshape(len(scenarios), n_steps)
+
+    np.testing.assert_array_equal(codes[:, 0], [2, 3, 1])
+    head_on, crossing, overtaking = codes
+    # 정면 통과 후에는 Head-on이 해소된다
+    assert set(np.unique(head_on)) == {0, 2}
+    assert head_on[-1] == 0
+    assert set(np.unique(crossing)) <= {0, 3}
+    assert np.all(overtaking == 1)
+
+    for step in (0, n_steps // 2, n_steps - 1):
+        for k, (position, heading, speed) in enumerate(scenarios.values()):
+            rel_velocity = np.array(heading_speed_to_velocity(heading, speed)) - os_velocity
+            situation = classifier.classify(
+                (0.0, 0.0), os_heading, os_speed,
+                tuple(np.asarray(position) + step * dt * rel_velocity), heading, speed
+            )
+            assert _CODE_TYPES[codes[k, step]] == situation.encounter_type
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+colregs_core.encounter.classifier 검증 테스트
+"""
+from colregs_core import EncounterClassifier, EncounterType, get_action_requirement
+
+
+def test_get_action_requirement():
+    classifier = EncounterClassifier()
+    for encounter_type in EncounterType:
+        assert get_action_requirement(encounter_type) == classifier.get_action_requirement(encounter_type)
+    assert "Rule 14" in get_action_requirement(EncounterType.HEAD_ON)
+    assert "우현" in get_action_requirement(EncounterType.HEAD_ON)
+    assert get_action_requirement("not-an-encounter") == "Unknown"
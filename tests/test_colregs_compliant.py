@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+ColregsCompliant 검증 테스트
+"""
+import numpy as np
+
+from colregs_core.reward import ColregsCompliant
+from colregs_core.utils import ref_course_angle
+
+
+def test_ref_course_cached_per_start_goal():
+    checker = ColregsCompliant()
+    start, goal = (0.0, 0.0), (100.0, 0.0)  # 기준 침로 0° (North)
+
+    assert np.isclose(checker._ref_course(start, goal), 0.0)
+    assert checker.is_compliant_headon(start, goal, os_heading=35.0)
+    assert not checker.is_compliant_headon(start, goal, os_heading=10.0)
+
+    # goal이 바뀌면 다시 계산 (기준 침로 90°, East)
+    goal = (0.0, 100.0)
+    assert np.isclose(checker._ref_course(start, goal), ref_course_angle(start, goal))
+    assert not checker.is_compliant_headon(start, goal, os_heading=35.0)
+    assert checker.is_compliant_standon(start, goal, os_heading=170.0)
+
+    # numpy (2, 1) 입력도 같은 key로 취급
+    assert np.isclose(
+        checker._ref_course(np.array([[0.0], [0.0]]), np.array([[0.0], [100.0]])), 90.0
+    )
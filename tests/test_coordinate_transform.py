@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+colregs_core.geometry.coordinate_transform 검증 테스트
+"""
+import numpy as np
+
+from colregs_core.geometry import math_to_ned_heading, math_to_ned_heading_array
+
+
+def test_math_to_ned_heading_array():
+    math_deg = np.array([0.0, 90.0, 180.0, -90.0, 45.0, -135.0, 270.0, 359.0])
+    expected = [math_to_ned_heading(h) for h in math_deg]
+    assert np.allclose(math_to_ned_heading_array(math_deg), expected)
+
+    # in-place 변환
+    buf = math_deg.copy()
+    assert math_to_ned_heading_array(buf, out=buf) is buf
+    assert np.allclose(buf, expected)
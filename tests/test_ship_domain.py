@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+colregs_core.risk.ship_domain 검증 테스트
+"""
+from colregs_core.risk import ShipDomainParams
+
+
+def test_ship_domain_params_uses_slots():
+    ship_domain = ShipDomainParams(r_bow=6.0, r_stern=2.0, r_starboard=6.0, r_port=2.0)
+    assert not hasattr(ship_domain, '__dict__')
+    ship_domain.r_bow = 10.0
+    assert ship_domain.r_bow == 10.0
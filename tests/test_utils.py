@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+colregs_core.utils 검증 테스트
+"""
+import numpy as np
+import pytest
+
+from colregs_core.utils import WrapTo180, WrapTo360, WrapTo180Array, WrapTo360Array, extract_xy
+
+
+def test_extract_xy_accepts_single_point_shapes():
+    for vec in ((1.0, 2.0), [1, 2], np.array([1.0, 2.0]),
+                np.array([[1.0], [2.0]]), np.array([[1.0, 2.0]])):
+        x, y = extract_xy(vec)
+        assert (x, y) == (1.0, 2.0)
+        assert type(x) is float and type(y) is float
+
+    with pytest.raises(ValueError):
+        extract_xy(np.zeros((2, 2)))
+
+
+def test_wrap_arrays_in_place():
+    deg = np.array([-720.0, -540.5, -180.0, -1e-7, 0.0, 179.9, 180.0, 359.9999999, 360.0, 725.0])
+    for wrap, wrap_array in ((WrapTo180, WrapTo180Array), (WrapTo360, WrapTo360Array)):
+        expected = [wrap(d) for d in deg]
+        assert np.allclose(wrap_array(deg), expected)
+        buf = deg.copy()
+        assert wrap_array(buf, out=buf) is buf
+        assert np.allclose(buf, expected)